@@ -3,33 +3,32 @@ import os
 import shutil
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import typer
 import yaml
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeRemainingColumn,
-)
-from rich.table import Table
-from rich.text import Text
 
-from ieeA.compiler import LaTeXCompiler
-from ieeA.downloader.arxiv import ArxivDownloader
-from ieeA.parser.latex_parser import LaTeXParser
 from ieeA.rules.config import load_config
 from ieeA.rules.glossary import load_glossary
-from ieeA.rules.examples import load_examples
-from ieeA.translator import get_sdk_client
-from ieeA.translator.pipeline import TranslationPipeline
-from ieeA.parser.structure import validate_translated_placeholders
-from ieeA.validator.engine import ValidationEngine
+
+# Heavier modules (LLM SDKs, parser, compiler, rich.progress) are imported
+# inside the commands that use them to keep `--help`, `config` and `glossary`
+# startup fast.
+
+# Prefer the LibYAML C bindings when PyYAML was built with them.
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper  # type: ignore[assignment]
+
+# Console line per placeholder issue type (see validate_translated_placeholders)
+_PH_FMT = {
+    "typo_fixed": "[yellow]  TYPO FIXED: chunk {cid}, {bad} → {fixed_to}[/yellow]",
+    "hallucination": "[yellow]  HALLUCINATION REMOVED: chunk {cid}, {bad} deleted[/yellow]",
+    "missing": "[red]  MISSING: chunk {cid}, {bad} lost in translation[/red]",
+}
 
 app = typer.Typer(
     name="ieeA",
@@ -53,6 +52,23 @@ def ensure_config_dir():
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _build_http_client(max_in_flight: int) -> Any:
+    """Pooled HTTP client for ``max_in_flight`` concurrent API requests.
+
+    Each request in flight gets its own connection, and waiting for one has
+    no separate deadline: a slow response is already bounded by ``read``.
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=60.0, read=300.0, write=60.0, pool=None),
+        limits=httpx.Limits(
+            max_connections=max_in_flight,
+            max_keepalive_connections=max_in_flight,
+        ),
+    )
+
+
 def _print_provider_cache_summary(provider: Any) -> None:
     get_summary = getattr(provider, "get_cache_stats_summary", None)
     if not callable(get_summary):
@@ -97,7 +113,9 @@ def _print_provider_cache_summary(provider: Any) -> None:
 
 @app.command()
 def translate(
-    arxiv_url: str = typer.Argument(..., help="arXiv ID or URL to translate"),
+    arxiv_urls: List[str] = typer.Argument(
+        ..., help="arXiv IDs or URLs to translate (several papers run concurrently)"
+    ),
     output_dir: Path = typer.Option(
         Path("output"), "-o", "--output-dir", help="Directory to save results"
     ),
@@ -123,12 +141,40 @@ def translate(
         help="启用高质量翻译模式，为每个 chunk 提供摘要上下文",
     ),
     abstract: Optional[str] = typer.Option(
-        None, "--abstract", help="手动提供摘要文本（覆盖自动提取）"
+        None, "--abstract", help="手动提供摘要文本（覆盖自动提取，仅限单篇论文）"
     ),
 ):
     """
-    Translate an arXiv paper to Chinese.
+    Translate one or more arXiv papers to Chinese.
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+    from rich.table import Table
+    from rich.text import Text
+
+    from ieeA.compiler import LaTeXCompiler
+    from ieeA.downloader.arxiv import ArxivDownloader
+    from ieeA.parser.latex_parser import LaTeXParser
+    from ieeA.parser.structure import validate_translated_placeholders
+    from ieeA.rules.examples import load_examples
+    from ieeA.translator import get_sdk_client
+    from ieeA.translator.pipeline import ChunkInput, TranslationPipeline
+    from ieeA.validator.engine import ValidationEngine
+
+    if abstract is not None and len(arxiv_urls) > 1:
+        # The abstract is context for one paper; others would get the wrong one
+        console.print(
+            "[bold red]Error:[/bold red] --abstract applies to a single paper; "
+            "translate papers one at a time to provide their abstracts."
+        )
+        raise typer.Exit(code=1)
+
     # Load configuration
     config = load_config()
 
@@ -148,280 +194,399 @@ def translate(
     console.print(
         Panel.fit(
             f"[bold blue]ieeA Translation Pipeline[/bold blue]\n"
-            f"Target: [cyan]{arxiv_url}[/cyan]\n"
+            f"Target: [cyan]{', '.join(arxiv_urls)}[/cyan]\n"
             f"SDK: [green]{sdk_name or 'HTTP'}[/green] ({model_name})\n"
             f"Output: [yellow]{output_dir}[/yellow]",
             title="Starting Job",
         )
     )
 
-    async def run_pipeline():
+    # Loaded once and shared by every paper in this run.
+    shared: dict[str, Any] = {
+        "http_client": None,
+        "glossary": None,
+        "examples": [],
+        "validator": None,
+    }
+    multi_paper = len(arxiv_urls) > 1
+
+    def complete_phase(progress, task, message: str) -> None:
+        # Finished phases leave the shared live display; a static line
+        # records them so only in-flight work keeps redrawing.
+        progress.remove_task(task)
+        console.print(message)
+
+    async def do_download(arxiv_url, progress, label):
+        task = progress.add_task(f"{label}Downloading source...", total=None)
+        downloader = ArxivDownloader()
         try:
-            # 1. Download
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Downloading source...", total=None)
-                downloader = ArxivDownloader()
-                try:
-                    download_result = downloader.download(arxiv_url, output_dir)
-                    progress.update(
-                        task, description=f"Downloaded: {download_result.arxiv_id}"
-                    )
-                except Exception as e:
-                    progress.update(
-                        task, description=f"[red]Download failed: {e}[/red]"
-                    )
-                    raise
-
-            # 2. Parse
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Parsing LaTeX...", total=None)
-                parser = LaTeXParser(
-                    extra_protected_envs=config.parser.extra_protected_environments,
-                    font_config=config.fonts,
-                )
-                try:
-                    doc = parser.parse_file(str(download_result.main_tex))
-                    progress.update(
-                        task, description=f"Parsed {len(doc.chunks)} chunks"
-                    )
-                except Exception as e:
-                    progress.update(task, description=f"[red]Parsing failed: {e}[/red]")
-                    raise
-
-            # Save parser state for placeholder validation
-            parser_state_path = (
-                output_dir / download_result.arxiv_id / "parser_state.json"
+            # Blocking network/disk work runs in a thread so the event loop
+            # (spinner, other papers' translation) keeps going.
+            download_result = await asyncio.get_running_loop().run_in_executor(
+                None, downloader.download, arxiv_url, output_dir
+            )
+            complete_phase(
+                progress, task, f"{label}Downloaded: {download_result.arxiv_id}"
+            )
+        except Exception:
+            # process_paper reports the failure
+            progress.remove_task(task)
+            raise
+        return download_result
+
+    async def do_parse(main_tex, job_dir, progress, label):
+        task = progress.add_task(f"{label}Parsing LaTeX...", total=None)
+        parser = LaTeXParser(
+            extra_protected_envs=config.parser.extra_protected_environments,
+            font_config=config.fonts,
+        )
+        try:
+            doc = await asyncio.get_running_loop().run_in_executor(
+                None, parser.parse_file, str(main_tex)
             )
-            doc.save_parser_state(parser_state_path)
+            complete_phase(progress, task, f"{label}Parsed {len(doc.chunks)} chunks")
+        except Exception:
+            progress.remove_task(task)
+            raise
+
+        # Save parser state for placeholder validation
+        doc.save_parser_state(job_dir / "parser_state.json")
+        return doc
+
+    def build_provider():
+        provider_kwargs: dict[str, Any] = {"temperature": config.llm.temperature}
+        if sdk_name in ("openai-coding", "anthropic-coding"):
+            provider_kwargs["full_glossary"] = shared["glossary"]
+
+        # Providers carry per-paper state (message history, prebuilt prompts,
+        # cache stats), so each paper gets its own on top of the shared pool.
+        provider = get_sdk_client(
+            sdk_name,
+            model=model_name,
+            key=key_val,
+            endpoint=endpoint_val,
+            http_client=shared["http_client"],
+            **provider_kwargs,
+        )
+        reset_cache_stats = getattr(provider, "reset_cache_stats", None)
+        if callable(reset_cache_stats):
+            try:
+                reset_cache_stats()
+            except Exception as e:
+                console.print(f"[yellow]Cache stats reset skipped: {e}[/yellow]")
+        return provider
+
+    async def do_translate(
+        job_dir, tex_dir, doc, provider, progress, label, paper_state
+    ):
+        console.print(f"\n[bold]{label}Translating...[/bold]")
+        glossary = shared["glossary"]
+
+        # Prepare high-quality mode parameters
+        abstract_text = None
+        if high_quality:
+            # Get abstract: CLI argument > extracted abstract > fallback
+            abstract_text = abstract or doc.abstract or ""
+
+        pipeline = TranslationPipeline(
+            provider=provider,
+            glossary=glossary,
+            state_file=job_dir / "translation_state.json",
+            few_shot_examples=shared["examples"],
+            abstract_context=abstract_text,
+            custom_system_prompt=config.translation.custom_system_prompt,
+            model_name=model_name,
+            hq_mode=high_quality,
+            batch_short_threshold=config.translation.batch_short_threshold,
+            batch_max_chars=config.translation.batch_max_chars,
+            sequential_mode=(sdk_name in ("openai-coding", "anthropic-coding")),
+        )
+        paper_state["pipeline"] = pipeline
 
-            # 3. Translate
-            console.print("\n[bold]Translating...[/bold]")
-            glossary = load_glossary()
-            provider_kwargs: dict[str, Any] = {"temperature": config.llm.temperature}
-            if sdk_name in ("openai-coding", "anthropic-coding"):
-                provider_kwargs["full_glossary"] = glossary
+        chunk_data = [ChunkInput(c.id, c.content) for c in doc.chunks]
 
-            provider = get_sdk_client(
-                sdk_name,
-                model=model_name,
-                key=key_val,
-                endpoint=endpoint_val,
-                **provider_kwargs,
-            )
-            reset_cache_stats = getattr(provider, "reset_cache_stats", None)
-            if callable(reset_cache_stats):
-                try:
-                    reset_cache_stats()
-                except Exception as e:
-                    console.print(
-                        f"[yellow]Cache stats reset skipped: {e}[/yellow]"
-                    )
+        console.print(
+            f"[bold]{label}Translating {len(chunk_data)} chunks (max {concurrency} concurrent)...[/bold]"
+        )
 
-            # Prepare high-quality mode parameters
-            abstract_text = None
-            examples = []
-            if high_quality:
-                # Get abstract: CLI argument > extracted abstract > fallback
-                abstract_text = abstract or getattr(doc, "abstract", "") or ""
-                # Load few-shot examples
-                examples_path = getattr(config.translation, "examples_path", None)
-                examples = (
-                    load_examples(examples_path) if examples_path else load_examples()
-                )
-                console.print(
-                    f"[cyan]High-quality mode enabled: {len(examples)} examples loaded[/cyan]"
-                )
+        batch_stats = {"batches": 0, "long_chunks": 0, "total_calls": 0}
 
-            pipeline = TranslationPipeline(
-                provider=provider,
-                glossary=glossary,
-                state_file=output_dir
-                / download_result.arxiv_id
-                / "translation_state.json",
-                few_shot_examples=examples,
-                abstract_context=abstract_text,
-                custom_system_prompt=config.translation.custom_system_prompt,
-                model_name=model_name,
-                hq_mode=high_quality,
-                batch_short_threshold=config.translation.batch_short_threshold,
-                batch_max_chars=config.translation.batch_max_chars,
-                sequential_mode=(sdk_name in ("openai-coding", "anthropic-coding")),
-            )
+        def on_batch_stats(num_batches: int, num_long: int, total_calls: int):
+            batch_stats["batches"] = num_batches
+            batch_stats["long_chunks"] = num_long
+            batch_stats["total_calls"] = total_calls
+
+        task_id = progress.add_task(
+            f"{label}Translating chunks...", total=len(chunk_data)
+        )
 
-            chunk_data = [{"chunk_id": c.id, "content": c.content} for c in doc.chunks]
+        # Coalesce redraws: each update takes Rich's render lock, so skip
+        # updates arriving within 50ms of the last one (the final one always lands)
+        last_update = [0.0]
+
+        def update_progress(completed: int, total: int):
+            now = time.monotonic()
+            if completed >= total or now - last_update[0] >= 0.05:
+                progress.update(task_id, completed=completed, total=total)
+                last_update[0] = now
+
+        translated_chunks = await pipeline.translate_document(
+            chunks=chunk_data,
+            context="Academic Paper",
+            max_concurrent=concurrency,
+            progress_callback=update_progress,
+            batch_stats_callback=on_batch_stats,
+        )
+        progress.remove_task(task_id)
 
+        if batch_stats["total_calls"] > 0:
             console.print(
-                f"[bold]Translating {len(chunk_data)} chunks (max {concurrency} concurrent)...[/bold]"
+                f"[cyan]{label}Batch optimization: {len(chunk_data)} chunks → "
+                f"{batch_stats['total_calls']} API calls "
+                f"({batch_stats['batches']} batches + {batch_stats['long_chunks']} long chunks)[/cyan]"
             )
 
-            batch_stats = {"batches": 0, "long_chunks": 0, "total_calls": 0}
-
-            def on_batch_stats(num_batches: int, num_long: int, total_calls: int):
-                batch_stats["batches"] = num_batches
-                batch_stats["long_chunks"] = num_long
-                batch_stats["total_calls"] = total_calls
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                console=console,
-            ) as progress:
-                task_id = progress.add_task(
-                    "Translating chunks...", total=len(chunk_data)
-                )
+        console.print(
+            f"[green]{label}Translation complete: {len(translated_chunks)} chunks[/green]"
+        )
+        _print_provider_cache_summary(provider)
+
+        # Reconstruct: translate_document returns results in doc.chunks order,
+        # so translations can be passed positionally instead of via a dict.
+        translations = [tc.translation for tc in translated_chunks]
+
+        translations, ph_issues = validate_translated_placeholders(translations, doc)
+
+        if ph_issues:
+            # Collect all lines and print once rather than once per issue
+            lines = [
+                f"\n[yellow]{label}Placeholder Issues ({len(ph_issues)}):[/yellow]"
+            ]
+            for issue in ph_issues:
+                fmt = _PH_FMT.get(issue["type"])
+                if fmt is not None:
+                    # Ids share a per-parser prefix, so only the full id is unique
+                    lines.append(fmt.format(cid=issue["chunk_id"], **issue))
+            console.print("\n".join(lines))
+
+        translated_tex, translated_chunk_start_lines = (
+            doc.reconstruct_with_chunk_start_lines(translations)
+        )
 
-                def update_progress(completed: int, total: int):
-                    progress.update(task_id, completed=completed, total=total)
+        # Save
+        out_file = tex_dir / "main_translated.tex"
+        out_file.write_text(translated_tex, encoding="utf-8")
+        console.print(f"[green]{label}Translation saved to {out_file}[/green]")
+        return translated_chunks, translated_tex, translated_chunk_start_lines
+
+    async def do_validate(
+        source_future,
+        translated_chunks,
+        translated_tex,
+        translated_chunk_start_lines,
+        label,
+    ):
+        console.print(f"\n[bold]{label}Validating...[/bold]")
+        validator = shared["validator"]
+
+        # Original text for validation, reconstructed once right after parsing
+        original_full, source_chunk_start_lines = await source_future
+
+        val_result = validator.validate(
+            translated_tex,
+            original_full,
+            translated_chunks=translated_chunks,
+            source_chunk_start_lines=source_chunk_start_lines,
+            translation_chunk_start_lines=translated_chunk_start_lines,
+        )
 
-                translated_chunks = await pipeline.translate_document(
-                    chunks=chunk_data,
-                    context="Academic Paper",
-                    max_concurrent=concurrency,
-                    progress_callback=update_progress,
-                    batch_stats_callback=on_batch_stats,
+        if val_result.valid:
+            console.print(f"[green]{label}Validation Passed[/green]")
+        else:
+            console.print(
+                f"[yellow]{label}Validation Issues ({len(val_result.errors)}):[/yellow]"
+            )
+            # Render all issues in one table, errors first; plain Text cells
+            # skip markup parsing of messages that may contain brackets.
+            severity_order = {"error": 0, "warning": 1, "info": 2}
+            table = Table(show_header=True, header_style="bold")
+            table.add_column("Severity")
+            table.add_column("Message")
+            table.add_column("Suggestion", style="dim")
+            for err in sorted(
+                val_result.errors, key=lambda e: severity_order.get(e.severity, 3)
+            ):
+                color = "red" if err.severity == "error" else "yellow"
+                table.add_row(
+                    Text(err.severity, style=color),
+                    Text(err.message, style=color),
+                    Text(err.suggestion or ""),
                 )
+            console.print(table)
 
-            if batch_stats["total_calls"] > 0:
+    async def do_compile(pdf_path, tex_dir, translated_tex, progress, label):
+        task = progress.add_task(f"{label}Compiling PDF...", total=None)
+        compiler = LaTeXCompiler(timeout=config.compilation.timeout)
+        try:
+            # main_translated.tex on disk already holds exactly this source
+            result = await compiler.compile_async(
+                translated_tex,
+                pdf_path,
+                working_dir=tex_dir,
+            )
+            if result.success:
+                complete_phase(progress, task, f"{label}Compiled: {result.pdf_path}")
                 console.print(
-                    f"[cyan]Batch optimization: {len(chunk_data)} chunks → "
-                    f"{batch_stats['total_calls']} API calls "
-                    f"({batch_stats['batches']} batches + {batch_stats['long_chunks']} long chunks)[/cyan]"
+                    Panel(f"[bold green]Success![/bold green]\nPDF: {result.pdf_path}")
                 )
+            else:
+                complete_phase(progress, task, f"[red]{label}Compilation failed[/red]")
+                console.print(f"[yellow]Error: {result.error_message}[/yellow]")
+                console.print(
+                    "[yellow]Generated .tex file is saved. You may try compiling it manually.[/yellow]"
+                )
+        except Exception as e:
+            complete_phase(
+                progress, task, f"[red]{label}Compilation failed: {e}[/red]"
+            )
+            console.print(
+                "[yellow]Generated .tex file is saved. You may try compiling it manually.[/yellow]"
+            )
 
-            results = [tc.model_dump() for tc in translated_chunks]
-            console.print(f"[green]Translation complete: {len(results)} chunks[/green]")
-            _print_provider_cache_summary(provider)
-
-            # Reconstruct
-            translated_map = {r["chunk_id"]: r["translation"] for r in results}
-
-            translated_map, ph_issues = validate_translated_placeholders(
-                translated_map, doc
+    def flush_partial_state(paper_state: dict[str, Any], label: str) -> None:
+        pipeline = paper_state["pipeline"]
+        if pipeline is None:
+            return
+        try:
+            pipeline.flush_state()
+            console.print(
+                f"[yellow]{label}Partial translation state saved; rerun to resume.[/yellow]"
+            )
+        except Exception as flush_error:
+            console.print(
+                f"[yellow]{label}Failed to save translation state: {flush_error}[/yellow]"
             )
 
-            if ph_issues:
-                console.print(
-                    f"\n[yellow]Placeholder Issues ({len(ph_issues)}):[/yellow]"
+    async def process_paper(arxiv_url: str, progress: Progress) -> bool:
+        # Stages depend on each other's output, so they run in sequence; the
+        # current stage is tracked so failures are reported precisely and
+        # partially completed translation state can be flushed for resume.
+        label = f"{arxiv_url}: " if multi_paper else ""
+        paper_state: dict[str, Any] = {"stage": None, "pipeline": None}
+        try:
+            paper_state["stage"] = "download"
+            download_result = await do_download(arxiv_url, progress, label)
+            # All per-paper outputs live under job_dir; derive paths from it once
+            job_dir = output_dir / download_result.arxiv_id
+            job_dir.mkdir(parents=True, exist_ok=True)
+            tex_dir = download_result.main_tex.parent
+
+            paper_state["stage"] = "parse"
+            # Set up the LLM client in a worker thread while the parser runs
+            provider_future = asyncio.get_running_loop().run_in_executor(
+                None, build_provider
+            )
+            try:
+                doc = await do_parse(download_result.main_tex, job_dir, progress, label)
+            except Exception:
+                provider_future.cancel()
+                raise
+
+            paper_state["stage"] = "translate"
+            # The untranslated reconstruction only depends on the parsed doc;
+            # build it in a worker thread while translation waits on the API.
+            source_future = asyncio.get_running_loop().run_in_executor(
+                None, doc.reconstruct_with_chunk_start_lines
+            )
+            try:
+                provider = await provider_future
+                (
+                    translated_chunks,
+                    translated_tex,
+                    translated_chunk_start_lines,
+                ) = await do_translate(
+                    job_dir, tex_dir, doc, provider, progress, label, paper_state
                 )
-                for issue in ph_issues:
-                    if issue["type"] == "typo_fixed":
-                        console.print(
-                            f"[yellow]  TYPO FIXED: chunk {issue['chunk_id'][:8]}..., "
-                            f"{issue['bad']} → {issue['fixed_to']}[/yellow]"
-                        )
-                    elif issue["type"] == "hallucination":
-                        console.print(
-                            f"[yellow]  HALLUCINATION REMOVED: chunk {issue['chunk_id'][:8]}..., "
-                            f"{issue['bad']} deleted[/yellow]"
-                        )
-                    elif issue["type"] == "missing":
-                        console.print(
-                            f"[red]  MISSING: chunk {issue['chunk_id'][:8]}..., "
-                            f"{issue['bad']} lost in translation[/red]"
-                        )
-
-            translated_tex, translated_chunk_start_lines = (
-                doc.reconstruct_with_chunk_start_lines(translated_map)
+            except Exception:
+                source_future.cancel()
+                raise
+
+            paper_state["stage"] = "validate"
+            await do_validate(
+                source_future,
+                translated_chunks,
+                translated_tex,
+                translated_chunk_start_lines,
+                label,
             )
 
-            # Save
-            out_file = download_result.main_tex.parent / "main_translated.tex"
-            out_file.write_text(translated_tex, encoding="utf-8")
-            console.print(f"[green]Translation saved to {out_file}[/green]")
-
-            # 4. Validate
-            console.print("\n[bold]Validating...[/bold]")
-            validator = ValidationEngine()
+            if not no_compile:
+                paper_state["stage"] = "compile"
+                pdf_path = job_dir / f"{download_result.arxiv_id}.pdf"
+                await do_compile(pdf_path, tex_dir, translated_tex, progress, label)
 
-            # Extract original text for validation
-            original_full, source_chunk_start_lines = (
-                doc.reconstruct_with_chunk_start_lines()
+        except Exception as e:
+            flush_partial_state(paper_state, label)
+            console.print(
+                f"[bold red]{label}Pipeline failed during {paper_state['stage']}:[/bold red] {e}"
             )
+            return False
+        except BaseException:
+            # Ctrl-C or a cancelled paper task: keep finished chunks, then
+            # let the interruption propagate.
+            flush_partial_state(paper_state, label)
+            raise
+        return True
 
-            val_result = validator.validate(
-                translated_tex,
-                original_full,
-                translated_chunks=translated_chunks,
-                source_chunk_start_lines=source_chunk_start_lines,
-                translation_chunk_start_lines=translated_chunk_start_lines,
-            )
+    async def run_pipeline():
+        # Limit how many papers are in flight at once; each paper fans out
+        # up to `concurrency` API requests.
+        papers_in_flight = min(4, len(arxiv_urls))
+        # One pooled HTTP client is shared by all translation requests so
+        # keep-alive connections are reused instead of re-handshaking.
+        http_client = _build_http_client(papers_in_flight * concurrency)
+        shared["http_client"] = http_client
+        # One live display for the whole run; each phase adds and removes
+        # its own task instead of starting a new Progress.
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        )
+        try:
+            with progress:
+                shared["glossary"] = load_glossary()
+                shared["validator"] = ValidationEngine()
+                if high_quality:
+                    # Load few-shot examples
+                    examples_path = config.translation.examples_path
+                    shared["examples"] = load_examples(examples_path)
+                    source = examples_path or "built-in examples"
+                    console.print(
+                        f"[cyan]High-quality mode enabled: {len(shared['examples'])} "
+                        f"examples loaded from {source}[/cyan]"
+                    )
 
-            if val_result.valid:
-                console.print("[green]Validation Passed[/green]")
-            else:
-                console.print(
-                    f"[yellow]Validation Issues ({len(val_result.errors)}):[/yellow]"
-                )
-                for err in val_result.errors:
-                    color = "red" if err.severity == "error" else "yellow"
-                    console.print(f"[{color}]- {err.message}[/{color}]")
-                    if err.suggestion:
-                        console.print(f"  Suggestion: {err.suggestion}", style="dim")
+                paper_semaphore = asyncio.Semaphore(papers_in_flight)
 
-            # 5. Compile
-            if not no_compile:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[bold blue]{task.description}"),
-                    console=console,
-                ) as progress:
-                    task = progress.add_task("Compiling PDF...", total=None)
-                    compiler = LaTeXCompiler(timeout=config.compilation.timeout)
-                    try:
-                        latex_source = out_file.read_text(encoding="utf-8")
-                        # Save the final version that will be compiled (for debugging)
-                        out_file.write_text(latex_source, encoding="utf-8")
-                        pdf_path = (
-                            output_dir
-                            / download_result.arxiv_id
-                            / f"{download_result.arxiv_id}.pdf"
-                        )
-                        result = compiler.compile(
-                            latex_source,
-                            pdf_path,
-                            working_dir=download_result.main_tex.parent,
-                        )
-                        if result.success:
-                            progress.update(
-                                task, description=f"Compiled: {result.pdf_path}"
-                            )
-                            console.print(
-                                Panel(
-                                    f"[bold green]Success![/bold green]\nPDF: {result.pdf_path}"
-                                )
-                            )
-                        else:
-                            progress.update(
-                                task, description=f"[red]Compilation failed[/red]"
-                            )
-                            console.print(
-                                f"[yellow]Error: {result.error_message}[/yellow]"
-                            )
-                            console.print(
-                                "[yellow]Generated .tex file is saved. You may try compiling it manually.[/yellow]"
-                            )
-                    except Exception as e:
-                        progress.update(
-                            task, description=f"[red]Compilation failed: {e}[/red]"
-                        )
-                        console.print(
-                            "[yellow]Generated .tex file is saved. You may try compiling it manually.[/yellow]"
-                        )
+                async def run_one(arxiv_url: str) -> bool:
+                    async with paper_semaphore:
+                        return await process_paper(arxiv_url, progress)
 
+                outcomes = await asyncio.gather(
+                    *(run_one(arxiv_url) for arxiv_url in arxiv_urls)
+                )
         except Exception as e:
             console.print(f"[bold red]Pipeline failed:[/bold red] {e}")
             raise typer.Exit(code=1)
+        finally:
+            await http_client.aclose()
+
+        if not all(outcomes):
+            raise typer.Exit(code=1)
 
     asyncio.run(run_pipeline())
 
@@ -443,8 +608,9 @@ def config_set(key: str, value: str):
 
     # Load raw yaml to preserve structure if possible, or just dict
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f) or {}
+        # Binary mode lets the YAML loader detect and decode UTF-8 itself
+        with open(CONFIG_FILE, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
     else:
         data = {}
 
@@ -476,7 +642,7 @@ def config_set(key: str, value: str):
     current[keys[-1]] = val
 
     with open(CONFIG_FILE, "w") as f:
-        yaml.dump(data, f)
+        yaml.dump(data, f, Dumper=_SafeDumper)
 
     console.print(f"[green]Updated {key} = {val}[/green]")
 
@@ -492,15 +658,15 @@ def glossary_add(
     ensure_config_dir()
 
     if GLOSSARY_FILE.exists():
-        with open(GLOSSARY_FILE, "r") as f:
-            data = yaml.safe_load(f) or {}
+        with open(GLOSSARY_FILE, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
     else:
         data = {}
 
     data[term] = {"target": translation, "domain": domain, "notes": notes}
 
     with open(GLOSSARY_FILE, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_SafeDumper, allow_unicode=True)
 
     console.print(f"[green]Added term:[/green] {term} -> {translation}")
 
@@ -518,6 +684,8 @@ def ping(
     """
     Test LLM connectivity. Sends a minimal request to verify the configured LLM is reachable.
     """
+    from ieeA.translator import get_sdk_client
+
     config = load_config()
 
     sdk_name = sdk or config.llm.sdk
@@ -570,6 +738,8 @@ def validate(
     """
     Validate a LaTeX file.
     """
+    from ieeA.validator.engine import ValidationEngine
+
     with open(tex_file, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -585,11 +755,20 @@ def validate(
         console.print("[green]File is valid![/green]")
     else:
         console.print(f"[red]Found {len(result.errors)} errors[/red]")
-        for err in result.errors:
-            console.print(f"- {err.message} ({err.severity})")
+        console.print(
+            "\n".join(f"- {err.message} ({err.severity})" for err in result.errors),
+            markup=False,
+        )
 
 
 def main():
+    # uvloop is optional; when installed asyncio.run() uses its faster loop
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     app()
 
 
@@ -1,6 +1,7 @@
+import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 class TeXCompiler:
     """
@@ -24,6 +25,29 @@ class TeXCompiler:
         Returns:
             Path to the generated PDF.
         """
+        cmd, work_dir, target_dir = self._prepare(tex_file, output_dir)
+
+        try:
+            # Run compilation twice for references
+            for _ in range(2):
+                # Output is never read; the .log file is consulted on failure
+                subprocess.run(
+                    cmd, 
+                    cwd=work_dir, 
+                    check=True, 
+                    stdout=subprocess.DEVNULL, 
+                    stderr=subprocess.DEVNULL,
+                    timeout=self.timeout
+                )
+        except subprocess.CalledProcessError as e:
+            raise self._compilation_error(target_dir, tex_file.stem) from e
+
+        return self._finish(target_dir, tex_file.stem)
+
+    def _prepare(
+        self, tex_file: Path, output_dir: Optional[Path]
+    ) -> Tuple[List[str], Path, Path]:
+        """Build the engine command; returns (cmd, work_dir, target_dir)."""
         if not tex_file.exists():
             raise FileNotFoundError(f"Source file not found: {tex_file}")
 
@@ -42,36 +66,46 @@ class TeXCompiler:
         else:
             target_dir = work_dir
 
+        return cmd, work_dir, target_dir
+
+    def _compilation_error(self, target_dir: Path, stem: str) -> RuntimeError:
+        # Include the tail of the log, where TeX reports the fatal error
+        log_file = target_dir / f"{stem}.log"
+        error_msg = f"Compilation failed."
+        if log_file.exists():
+            error_msg += f" Check log: {log_file}"
+            tail = self._read_log_tail(log_file)
+            if tail:
+                error_msg += f"\n{tail}"
+        return RuntimeError(error_msg)
+
+    def _read_log_tail(self, log_file: Path, size: int = 4096) -> str:
         try:
-            # Run compilation twice for references
-            for _ in range(2):
-                subprocess.run(
-                    cmd, 
-                    cwd=work_dir, 
-                    check=True, 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE,
-                    timeout=self.timeout
-                )
-        except subprocess.CalledProcessError as e:
-            # Capture log output if possible
-            log_file = target_dir / f"{tex_file.stem}.log"
-            error_msg = f"Compilation failed."
-            if log_file.exists():
-                error_msg += f" Check log: {log_file}"
-            raise RuntimeError(error_msg) from e
-            
-        pdf_file = target_dir / f"{tex_file.stem}.pdf"
+            with open(log_file, "rb") as f:
+                f.seek(0, 2)
+                f.seek(max(f.tell() - size, 0))
+                return f.read().decode("utf-8", errors="replace").strip()
+        except OSError:
+            return ""
+
+    def _finish(self, target_dir: Path, stem: str) -> Path:
+        pdf_file = target_dir / f"{stem}.pdf"
         
         if self.clean_aux:
-            self._cleanup(target_dir, tex_file.stem)
+            self._cleanup(target_dir, stem)
             
         return pdf_file
 
     def _cleanup(self, directory: Path, stem: str):
         """Remove auxiliary files."""
-        extensions = ['.aux', '.log', '.out', '.toc', '.snm', '.nav']
-        for ext in extensions:
-            f = directory / f"{stem}{ext}"
-            if f.exists():
-                f.unlink()
+        extensions = {'.aux', '.log', '.out', '.toc', '.snm', '.nav'}
+        stem_len = len(stem)
+        # One directory scan instead of an exists()/unlink() pair per extension
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(stem) and name[stem_len:] in extensions:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
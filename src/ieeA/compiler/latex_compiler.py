@@ -1,6 +1,6 @@
+import asyncio
 import os
 import shutil
-import subprocess
 import tempfile
 import re
 from dataclasses import dataclass
@@ -9,6 +9,13 @@ from typing import List, Optional, Tuple, Union
 
 from .chinese_support import inject_chinese_support
 
+# tmpfs for the compile directory, so .aux/.toc/.bbl written by one pass and
+# read by the next never touch persistent storage.
+SHM_DIR = Path("/dev/shm")
+# Headroom kept free on the build filesystem beyond the copied resources
+# and the PDF built from them.
+_BUILD_ROOT_HEADROOM = 64 * 1024 * 1024
+
 
 @dataclass
 class CompilationResult:
@@ -20,8 +27,16 @@ class CompilationResult:
 
 
 class LaTeXCompiler:
-    def __init__(self, timeout: int = 120):
+    def __init__(self, timeout: int = 120, build_root: Optional[Path] = SHM_DIR):
+        """
+        Args:
+            timeout: Seconds allowed for each engine pass.
+            build_root: Where the temporary compile directory is created when
+                        it exists and has room for the resources; otherwise
+                        (or if None) the system temp directory is used.
+        """
         self.timeout = timeout
+        self.build_root = build_root
         # Priority: xelatex (best CJK), lualatex (good CJK), pdflatex (fallback)
         self.engines = ["xelatex", "lualatex", "pdflatex"]
 
@@ -34,10 +49,24 @@ class LaTeXCompiler:
         latex_source: str,
         output_path: Union[str, Path],
         working_dir: Optional[Union[str, Path]] = None,
+    ) -> CompilationResult:
+        """Blocking wrapper around compile_async for callers without a loop."""
+        return asyncio.run(
+            self.compile_async(latex_source, output_path, working_dir=working_dir)
+        )
+
+    async def compile_async(
+        self,
+        latex_source: str,
+        output_path: Union[str, Path],
+        working_dir: Optional[Union[str, Path]] = None,
     ) -> CompilationResult:
         """
         Compiles LaTeX source to PDF using multiple engines with fallback.
 
+        Engine and bibliography passes run as asyncio subprocesses, so the
+        event loop keeps serving other work while TeX runs.
+
         Args:
             latex_source: The LaTeX code to compile.
             output_path: Where to save the generated PDF.
@@ -45,16 +74,21 @@ class LaTeXCompiler:
                          If provided, contents are copied to the temp compile dir.
         """
         output_path = Path(output_path).resolve()
+        working_dir_path = Path(working_dir) if working_dir else None
+        if working_dir_path is not None and not working_dir_path.exists():
+            working_dir_path = None
+
+        build_root = await asyncio.to_thread(self._pick_build_root, working_dir_path)
 
         # Create a temporary directory for compilation to keep things clean
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(prefix="ieeA-tex-", dir=build_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # If working_dir is provided, copy its contents to temp_dir
-            if working_dir:
-                working_dir_path = Path(working_dir)
-                if working_dir_path.exists():
-                    self._copy_resources(working_dir_path, temp_path)
+            if working_dir_path is not None:
+                await asyncio.to_thread(
+                    self._copy_resources, working_dir_path, temp_path
+                )
 
             # Write source to file
             source_file = temp_path / "main.tex"
@@ -68,7 +102,7 @@ class LaTeXCompiler:
                 if not shutil.which(engine):
                     continue
 
-                success, log, error = self._run_engine(
+                success, log, error = await self._run_engine(
                     engine, source_file, temp_path, latex_source
                 )
 
@@ -96,6 +130,34 @@ class LaTeXCompiler:
                 engine_used=None,
             )
 
+    def _pick_build_root(self, resources: Optional[Path]) -> Optional[Path]:
+        """Return build_root if the compile directory fits there, else None.
+
+        tmpfs is often small (64 MB by default in Docker), so the resources
+        and the PDF built from them must fit with some headroom to spare.
+        """
+        root = self.build_root
+        if root is None or not root.is_dir() or not os.access(root, os.W_OK | os.X_OK):
+            return None
+        needed = 2 * (self._tree_size(resources) if resources else 0)
+        try:
+            free = shutil.disk_usage(root).free
+        except OSError:
+            return None
+        if free < needed + _BUILD_ROOT_HEADROOM:
+            return None
+        return root
+
+    def _tree_size(self, root: Path) -> int:
+        total = 0
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, name)).st_size
+                except OSError:
+                    pass
+        return total
+
     def _copy_resources(self, src: Path, dst: Path):
         """Copies resource files from src to dst, ignoring hidden files."""
         try:
@@ -112,13 +174,13 @@ class LaTeXCompiler:
             # Ignore copy errors (e.g. permission issues), compilation might still work
             pass
 
-    def _run_engine(
+    async def _run_engine(
         self, engine: str, source_file: Path, cwd: Path, latex_source: str
     ) -> Tuple[bool, str, Optional[str]]:
         """Runs the full compilation cycle: (xelatex + bibtex) × 2."""
 
         # 1. First xelatex pass (generate .aux for bibtex)
-        success, log, error = self._run_single_pass(engine, source_file, cwd)
+        success, log, error = await self._run_single_pass(engine, source_file, cwd)
         # Don't fail on first pass - references will be unresolved
 
         # 2. Check for existing .bbl file (pre-compiled bibliography)
@@ -131,20 +193,20 @@ class LaTeXCompiler:
         # 3. Run bibtex (always try if bibliography command exists)
         bib_tool = self._detect_bibliography_tool(latex_source)
         if bib_tool and shutil.which(bib_tool):
-            self._run_bibliography_tool(bib_tool, cwd)
+            await self._run_bibliography_tool(bib_tool, cwd)
 
         # 4. Second xelatex pass (incorporate bibliography)
-        self._run_single_pass(engine, source_file, cwd)
+        await self._run_single_pass(engine, source_file, cwd)
 
         # 5. Run bibtex again (resolve any new citations)
         if bib_tool and shutil.which(bib_tool):
-            self._run_bibliography_tool(bib_tool, cwd)
+            await self._run_bibliography_tool(bib_tool, cwd)
 
         # 6. Third xelatex pass (resolve all cross-references)
-        self._run_single_pass(engine, source_file, cwd)
+        await self._run_single_pass(engine, source_file, cwd)
 
         # 7. Fourth xelatex pass (final - ensure all references resolved)
-        success, log, error = self._run_single_pass(engine, source_file, cwd)
+        success, log, error = await self._run_single_pass(engine, source_file, cwd)
 
         return success, log, error
 
@@ -157,40 +219,48 @@ class LaTeXCompiler:
             return "bibtex"
         return None
 
-    def _run_bibliography_tool(self, tool: str, cwd: Path) -> bool:
+    async def _run_bibliography_tool(self, tool: str, cwd: Path) -> bool:
         cmd = [tool, "main"]
         try:
-            subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                timeout=60,
-                encoding="utf-8",
-                errors="replace",
-            )
+            await self._run_process(cmd, cwd, timeout=60)
             return True
         except Exception:
             return False
 
-    def _run_single_pass(
+    async def _run_process(
+        self, cmd: List[str], cwd: Path, timeout: float
+    ) -> Tuple[int, str]:
+        """Run cmd without blocking the event loop; returns (returncode, stderr).
+
+        stdout is discarded rather than buffered: TeX repeats it in main.log.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except BaseException:
+            # Timed out or cancelled: don't leave the engine running
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        return process.returncode, stderr.decode("utf-8", errors="replace")
+
+    async def _run_single_pass(
         self, engine: str, source_file: Path, cwd: Path
     ) -> Tuple[bool, str, Optional[str]]:
         """Runs a single pass of the latex engine."""
         cmd = [engine, "-interaction=nonstopmode", source_file.name]
 
         try:
-            process = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                encoding="utf-8",
-                errors="replace",
-            )
+            returncode, stderr = await self._run_process(cmd, cwd, self.timeout)
 
-            # Read log file if it exists, as it's more complete than stdout
-            log_content = process.stdout + "\n" + process.stderr
+            # Read log file if it exists, as it's more complete than stderr
+            log_content = stderr
             log_file = cwd / "main.log"
             if log_file.exists():
                 try:
@@ -201,12 +271,12 @@ class LaTeXCompiler:
                     pass
 
             pdf_file = cwd / "main.pdf"
-            if process.returncode == 0 or pdf_file.exists():
+            if returncode == 0 or pdf_file.exists():
                 return True, log_content, None
             else:
                 return False, log_content, self._extract_error(log_content)
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return False, "Timeout expired", "Compilation timed out"
         except Exception as e:
             return False, str(e), str(e)
@@ -61,6 +61,13 @@ class LatexChunker:
         self.current_preserved: Dict[str, str] = {}
         self.math_counter = 0
         self.protected_counter = 0
+        # Chunk ids: one random prefix per chunker plus a sequence number
+        self._chunk_id_prefix = uuid.uuid4().hex
+        self._chunk_seq = 0
+
+    def _next_chunk_id(self) -> str:
+        self._chunk_seq += 1
+        return f"{self._chunk_id_prefix}-{self._chunk_seq}"
 
     def chunk_nodes(self, nodes: List[LatexNode]) -> List[Chunk]:
         """
@@ -85,7 +92,7 @@ class LatexChunker:
         if not text:
             return
 
-        chunk_id = str(uuid.uuid4())
+        chunk_id = self._next_chunk_id()
         chunk = Chunk(
             id=chunk_id,
             content=text,
@@ -205,7 +212,7 @@ class LatexChunker:
                 # Alternative: Explicitly construct "\name{...}"
                 # If we are strictly processing specific macros:
 
-                chunk_id = str(uuid.uuid4())
+                chunk_id = self._next_chunk_id()
                 chunk = Chunk(
                     id=chunk_id,
                     content=full_content,
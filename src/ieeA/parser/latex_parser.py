@@ -1,13 +1,168 @@
 import os
 import re
 import uuid
+import warnings
+from functools import lru_cache
+from itertools import chain
 from typing import Optional, Tuple, List, Dict, Set
 
 from .structure import LaTeXDocument, Chunk
 
+# Patterns are compiled once at import; parsing a document applies them
+# thousands of times (e.g. the structural check runs on every body line).
+# Placeholders are generated ASCII, so their patterns use re.ASCII and \d
+# skips the Unicode digit lookup.
+_PLACEHOLDER_RE = re.compile(r"\[\[[A-Z_]+_\d+\]\]", re.ASCII)
+_CHUNK_PLACEHOLDER_RE = re.compile(r"\{\{CHUNK_[a-f0-9-]+\}\}", re.ASCII)
+_SINGLE_BRACE_CHUNK_RE = re.compile(r"\{CHUNK_[a-f0-9-]+\}", re.ASCII)
+_CHUNK_ID_RE = re.compile(r"\{\{CHUNK_([a-f0-9-]+)\}\}", re.ASCII)
+_ABSTRACT_RE = re.compile(r"\\begin\{abstract\}(.*?)\\end\{abstract\}", re.DOTALL)
+# A whole line whose first non-blank character is %, with its newline
+_COMMENT_LINE_RE = re.compile(r"^[^\S\n]*%[^\n]*\n?", re.MULTILINE)
+_AUTHOR_RE = re.compile(r"(\\author\s*\{)", re.DOTALL)
+_TITLE_RE = re.compile(r"(\\title\s*\{)")
+# \caption, \caption* or \captionof (group 1) plus the whitespace after it
+_CAPTION_CMD_RE = re.compile(r"\\caption(of|\*)?(?![A-Za-z*])\s*")
+_FOOTNOTE_CMD_RE = re.compile(r"\\footnote(?![A-Za-z])")
+# Commands protected whole (brace-counted argument); group 1 is the name,
+# with includegraphics' optional argument folded in.
+_PROTECTED_COMMAND_RE = re.compile(
+    r"\\(cite|ref|eqref|label|url|href|includegraphics(?:\[[^\]]*\])?)\s*\{"
+)
+_PROTECTED_COMMAND_PREFIXES = {
+    "cite": "CITE",
+    "ref": "REF",
+    "eqref": "REF",
+    "label": "LABEL",
+    "url": "URL",
+    "href": "HREF",
+}
+# What doesn't count as prose when sizing a paragraph. Placeholders are
+# removed first: a command next to one (\textbf[[MATH_1]]{x}) only gets its
+# arguments once the placeholder is gone, so the two passes can't be fused.
+_ANY_PLACEHOLDER_RE = re.compile(
+    r"\[\[[A-Z_]+_\d+\]\]|\{\{CHUNK_[a-f0-9-]+\}\}", re.ASCII
+)
+# LaTeX commands (with optional/mandatory args) or stray brace/bracket chars.
+# The argument classes exclude _PARAGRAPH_SEP so a batch never matches across
+# two paragraphs.
+_CLEAN_RE = re.compile(
+    r"\\[a-zA-Z]+\*?(?:\[[^\]\x00]*\])?(?:\{[^}\x00]*\})*|[{}\[\]\\]",
+    re.ASCII,
+)
+_PARAGRAPH_SEP = "\x00"
+_INPUT_INCLUDE_RE = re.compile(r"(^|[^%])\\(input|include)\{([^}]+)\}")
+_BIBLIOGRAPHY_RE = re.compile(r"\\bibliography\{([^}]+)\}")
+_BIBLIOGRAPHYSTYLE_RE = re.compile(r"\\bibliographystyle\{[^}]+\}\n?")
+_TRAILING_COMMENT_RE = re.compile(r"(?<!\\)%.*$")
+_VERBATIM_TAG_RE = re.compile(r"\\(begin|end)\{(?:verbatim|lstlisting|minted|comment)\}")
+_BEGIN_DOCUMENT = "\\begin{document}"
+# A brace, or an escaped character (so \{ and \} don't count as braces)
+_BRACE_RE = re.compile(r"\\.|[{}]", re.DOTALL)
+# A math delimiter, or an escaped \$ (matched as a unit so it is skipped)
+_DOLLAR_RE = re.compile(r"\\\$|\$")
+_DOUBLE_DOLLAR_RE = re.compile(r"\\\$|\$\$")
+_ENV_TOKEN_RE = re.compile(r"\\(begin|end)")
+_DISPLAY_MATH_OPEN_RE = re.compile(r"\\[\[(]")
+_DISPLAY_MATH_CLOSE = {"\\[": "\\]", "\\(": "\\)"}
+
+# Lines that are never part of a translatable paragraph are recognised by
+# literal prefixes; str.startswith(tuple) checks them without the regex engine.
+_STRUCTURAL_PREFIXES = (
+    "\\begin{",
+    "\\end{",
+    "%",
+    "\\hline",
+    "\\toprule",
+    "\\midrule",
+    "\\bottomrule",
+    "\\section",
+    "\\subsection",
+    "\\subsubsection",
+    "\\paragraph",
+    "\\subparagraph",
+    "\\chapter",
+    "\\part",
+    "\\title",
+    "\\author",
+    "\\maketitle",
+    "\\bibliographystyle",
+    "\\bibliography",
+    "\\tableofcontents",
+    "\\listoffigures",
+    "\\listoftables",
+    "\\newpage",
+    "\\clearpage",
+    "\\balance",
+)
+# These may also be indented
+_STRUCTURAL_INDENTED_PREFIXES = ("\\item", "\\label", "\\caption", "\\centering", "&")
+# Characters a stripped structural line can start with
+_STRUCTURAL_FIRST_CHARS = frozenset("\\%&[]")
+
+
+def _has_include_directive(text: str) -> bool:
+    return "\\input" in text or "\\include" in text
+
+
+class _FlattenFrame:
+    """One file being flattened by LaTeXParser._flatten_latex."""
+
+    __slots__ = ("content", "base_dir", "path", "matches", "pos", "out")
+
+    def __init__(self, content: str, base_dir: str, path: Optional[str] = None):
+        self.content = content
+        self.base_dir = base_dir
+        self.path = path
+        self.matches = _INPUT_INCLUDE_RE.finditer(content)
+        self.pos = 0
+        self.out: List[str] = []
+
+
+@lru_cache(maxsize=None)
+def _env_begin_re(envs: frozenset) -> re.Pattern:
+    """One alternation over environment names; group 1 is the name."""
+    names = "|".join(re.escape(env) for env in sorted(envs))
+    return re.compile(r"\\begin\{(" + names + r")\}")
+
+
+@lru_cache(maxsize=None)
+def _balanced_group_re(open_char: str, close_char: str) -> re.Pattern:
+    """Matches an escaped character or either delimiter."""
+    return re.compile(
+        r"\\.|[" + re.escape(open_char) + re.escape(close_char) + "]", re.DOTALL
+    )
+
+
+@lru_cache(maxsize=None)
+def _env_tag_re(env: str) -> re.Pattern:
+    """Matches \\begin{env} or \\end{env}; group 1 is "begin" or "end"."""
+    return re.compile(r"\\(begin|end)\{" + re.escape(env) + r"\}")
+
+
+@lru_cache(maxsize=None)
+def _section_commands_re(cmds: frozenset) -> re.Pattern:
+    """One alternation over section commands; group 1 is the command name."""
+    names = "|".join(sorted(cmds))
+    return re.compile(r"\\(" + names + r")(\*?)(\s*\{)")
+
+
+_PLACEHOLDER_NAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+
 
 def is_placeholder_only(content: str) -> bool:
-    return bool(re.fullmatch(r"\[\[[A-Z_]+_\d+\]\]", content.strip()))
+    # String-op equivalent of _PLACEHOLDER_RE.fullmatch(content.strip()):
+    # digits never contain "_", so the last "_" separates name from number.
+    s = content.strip()
+    if not (s.startswith("[[") and s.endswith("]]")):
+        return False
+    name, sep, num = s[2:-2].rpartition("_")
+    return (
+        bool(name)
+        and num.isascii()
+        and num.isdigit()
+        and _PLACEHOLDER_NAME_CHARS.issuperset(name)
+    )
 
 
 class LaTeXParser:
@@ -74,6 +229,16 @@ class LaTeXParser:
         self._protected_envs: Set[str] = set(self.PROTECTED_ENVIRONMENTS)
         if extra_protected_envs:
             self._protected_envs.update(extra_protected_envs)
+        # Chunk ids are a per-parser random prefix plus a counter: unique
+        # without drawing from the OS RNG for every chunk.
+        self._chunk_id_prefix = uuid.uuid4().hex
+        self._chunk_seq = 0
+        # Directory listings used to resolve \input/\bibliography targets
+        self._dir_entries: Dict[str, Set[str]] = {}
+
+    def _next_chunk_id(self) -> str:
+        self._chunk_seq += 1
+        return f"{self._chunk_id_prefix}-{self._chunk_seq}"
 
     def extract_abstract(self, content: str) -> Optional[str]:
         """Extract abstract content from LaTeX document.
@@ -85,16 +250,13 @@ class LaTeXParser:
             Abstract text or None if not found
         """
         # Match \begin{abstract}...\end{abstract}
-        pattern = re.compile(r"\\begin\{abstract\}(.*?)\\end\{abstract\}", re.DOTALL)
-        match = pattern.search(content)
+        match = _ABSTRACT_RE.search(content)
         if match:
             abstract_text = match.group(1)
             # Filter out LaTeX comment lines (lines starting with %)
-            lines = abstract_text.split("\n")
-            filtered_lines = [
-                line for line in lines if not line.strip().startswith("%")
-            ]
-            abstract_text = "\n".join(filtered_lines).strip()
+            if "%" in abstract_text:
+                abstract_text = _COMMENT_LINE_RE.sub("", abstract_text)
+            abstract_text = abstract_text.strip()
             # Truncate to ~500 tokens (≈2000 chars)
             if len(abstract_text) > 2000:
                 abstract_text = abstract_text[:2000] + "..."
@@ -103,6 +265,7 @@ class LaTeXParser:
 
     def parse_file(self, filepath: str) -> LaTeXDocument:
         base_dir = os.path.dirname(os.path.abspath(filepath))
+        self._dir_entries = {}
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
 
@@ -122,36 +285,22 @@ class LaTeXParser:
 
         body_template = self._process_body(body_content)
 
-        # Consistency check: all chunks should have placeholders
-        import warnings
-
-        chunk_ids_in_preamble = set(re.findall(r"\{\{CHUNK_([a-f0-9-]+)\}\}", preamble))
-        chunk_ids_in_body = set(
-            re.findall(r"\{\{CHUNK_([a-f0-9-]+)\}\}", body_template)
-        )
-        nested_chunk_ids = set()
-        for chunk in self.chunks:
-            nested_chunk_ids.update(
-                re.findall(r"\{\{CHUNK_([a-f0-9-]+)\}\}", chunk.content)
-            )
-        chunk_ids_in_global_placeholders = set()
-        for original in self.placeholder_map.values():
-            chunk_ids_in_global_placeholders.update(
-                re.findall(r"\{\{CHUNK_([a-f0-9-]+)\}\}", original)
-            )
-        all_placeholder_ids = (
-            chunk_ids_in_preamble
-            | chunk_ids_in_body
-            | nested_chunk_ids
-            | chunk_ids_in_global_placeholders
-        )
-        chunk_ids_created = set(c.id for c in self.chunks)
-        protected_chunk_ids = set(c.id for c in self.chunks if c.context == "protected")
-
-        orphan_ids = chunk_ids_created - all_placeholder_ids - protected_chunk_ids
-        if orphan_ids:
+        # Consistency check: all chunks should have placeholders.
+        # Placeholders can sit in the preamble, the body, other chunks or
+        # protected originals; texts without one are skipped by a substring test
+        all_placeholder_ids: Set[str] = set()
+        for text in chain(
+            (preamble, body_template),
+            (c.content for c in self.chunks),
+            self.placeholder_map.values(),
+        ):
+            if "{{CHUNK_" in text:
+                all_placeholder_ids.update(_CHUNK_ID_RE.findall(text))
+
+        orphan_count = sum(1 for c in self.chunks if c.id not in all_placeholder_ids)
+        if orphan_count:
             warnings.warn(
-                f"LaTeX Parser: {len(orphan_ids)} chunk(s) created without placeholders. "
+                f"LaTeX Parser: {orphan_count} chunk(s) created without placeholders. "
                 f"This may cause untranslated content in output.",
                 UserWarning,
             )
@@ -165,44 +314,31 @@ class LaTeXParser:
         )
 
     def _protect_author_block(self, text: str) -> str:
+        if "\\author" not in text:
+            return text
+
         # Match \author{ start
-        pattern = re.compile(r"(\\author\s*\{)", re.DOTALL)
         result = []
         pos = 0
 
-        for match in pattern.finditer(text):
+        for match in _AUTHOR_RE.finditer(text):
             # Add text before the match
             result.append(text[pos : match.start()])
 
             # Find the matching closing brace
             start = match.end()
-            brace_count = 1
-            i = start
-
-            while i < len(text) and brace_count > 0:
-                if text[i] == "{":
-                    brace_count += 1
-                elif text[i] == "}":
-                    brace_count -= 1
-                i += 1
+            i = self._find_closing_brace(text, start)
 
             # Check if we found the closing brace
-            if brace_count == 0:
+            if i is not None:
                 # Extract the full author block including \author{...}
                 full_block = match.group(0) + text[start:i]
 
+                # Nothing to translate: keep it with the other protected
+                # elements rather than as a placeholder-only chunk
                 self.protected_counter += 1
                 placeholder = f"[[AUTHOR_{self.protected_counter}]]"
-                chunk_id = str(uuid.uuid4())
-
-                chunk = Chunk(
-                    id=chunk_id,
-                    content=placeholder,
-                    latex_wrapper="%s",
-                    context="protected",
-                    preserved_elements={placeholder: full_block},
-                )
-                self.chunks.append(chunk)
+                self.placeholder_map[placeholder] = full_block
                 result.append(placeholder)
                 pos = i
             else:
@@ -222,24 +358,18 @@ class LaTeXParser:
 
     def _extract_title_command(self, text: str) -> str:
         """Extract \\title{...} command content and create title chunks."""
-        pattern = re.compile(r"(\\title\s*\{)")
+        if "\\title" not in text:
+            return text
+
         result = []
         pos = 0
 
-        for match in pattern.finditer(text):
+        for match in _TITLE_RE.finditer(text):
             result.append(text[pos : match.start()])
             start = match.end()
-            brace_count = 1
-            i = start
-
-            while i < len(text) and brace_count > 0:
-                if text[i] == "{":
-                    brace_count += 1
-                elif text[i] == "}":
-                    brace_count -= 1
-                i += 1
+            i = self._find_closing_brace(text, start)
 
-            if brace_count == 0:
+            if i is not None:
                 content = text[start : i - 1]
                 stripped_content = content.strip()
                 if (
@@ -249,7 +379,7 @@ class LaTeXParser:
                 ):
                     result.append(match.group(0) + content + "}")
                 else:
-                    chunk_id = str(uuid.uuid4())
+                    chunk_id = self._next_chunk_id()
                     placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
                     chunk = Chunk(
                         id=chunk_id,
@@ -274,6 +404,20 @@ class LaTeXParser:
             i += 1
         return i
 
+    def _find_closing_brace(self, text: str, start: int) -> Optional[int]:
+        """Return the index just past the brace closing a group opened before start."""
+        depth = 1
+        # Jump from brace to brace instead of stepping through every character
+        for match in _BRACE_RE.finditer(text, start):
+            ch = match.group()
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        return None
+
     def _parse_balanced_group(
         self, text: str, start: int, open_char: str, close_char: str
     ) -> Tuple[Optional[str], Optional[int]]:
@@ -282,20 +426,17 @@ class LaTeXParser:
             return None, None
 
         depth = 1
-        i = start + 1
-        while i < len(text):
-            ch = text[i]
-            if ch == "\\":
-                # Skip escaped character so \\{ and \\} don't affect nesting.
-                i += 2
-                continue
+        for match in _balanced_group_re(open_char, close_char).finditer(
+            text, start + 1
+        ):
+            ch = match.group()
+            # Escaped characters (\\{, \\}) are matched whole and don't affect nesting.
             if ch == open_char:
                 depth += 1
             elif ch == close_char:
                 depth -= 1
                 if depth == 0:
-                    return text[start + 1 : i], i + 1
-            i += 1
+                    return text[start + 1 : match.start()], match.end()
         return None, None
 
     def _parse_environment_token_at(
@@ -317,73 +458,70 @@ class LaTeXParser:
     ) -> Optional[int]:
         """Find matching \\end{env_name} from search_start with nesting support."""
         depth = 1
-        i = search_start
-        while i < len(text):
-            begin_env, begin_end = self._parse_environment_token_at(text, i, "begin")
-            if begin_env is not None and begin_end is not None:
-                if begin_env == env_name:
-                    depth += 1
-                i = begin_end
+        pos = search_start
+        # Only positions where a \\begin/\\end token can start are visited
+        while True:
+            match = _ENV_TOKEN_RE.search(text, pos)
+            if match is None:
+                return None
+
+            token = match.group(1)
+            env, token_end = self._parse_environment_token_at(
+                text, match.start(), token
+            )
+            if env is None or token_end is None:
+                pos = match.end()
                 continue
 
-            end_env, end_end = self._parse_environment_token_at(text, i, "end")
-            if end_env is not None and end_end is not None:
-                if end_env == env_name:
+            if env == env_name:
+                if token == "begin":
+                    depth += 1
+                else:
                     depth -= 1
                     if depth == 0:
-                        return end_end
-                i = end_end
-                continue
-
-            i += 1
-        return None
+                        return token_end
+            pos = token_end
 
     def _build_caption_no_scan_ranges(self, text: str) -> List[Tuple[int, int]]:
         """Build ranges where caption scanning should be disabled."""
         ranges: List[Tuple[int, int]] = []
-        i = 0
-        while i < len(text):
+        pos = 0
+        while True:
+            i = text.find("\\begin", pos)
+            if i == -1:
+                return ranges
+
             env_name, begin_end = self._parse_environment_token_at(text, i, "begin")
-            if env_name is not None and begin_end is not None:
-                if env_name in self.CAPTION_NO_SCAN_ENVIRONMENTS:
-                    end_idx = self._find_environment_end(text, begin_end, env_name)
-                    if end_idx is None:
-                        end_idx = len(text)
-                    ranges.append((i, end_idx))
-                    i = end_idx
-                    continue
-                i = begin_end
+            if env_name is None or begin_end is None:
+                pos = i + 1
                 continue
-            i += 1
-        return ranges
+
+            if env_name in self.CAPTION_NO_SCAN_ENVIRONMENTS:
+                end_idx = self._find_environment_end(text, begin_end, env_name)
+                if end_idx is None:
+                    end_idx = len(text)
+                ranges.append((i, end_idx))
+                pos = end_idx
+            else:
+                pos = begin_end
 
     def _parse_caption_command_at(
-        self, text: str, cmd_start: int
+        self, text: str, match: re.Match
     ) -> Tuple[Optional[int], Optional[int], Optional[str], Optional[str]]:
-        """Parse caption family command at cmd_start.
+        """Parse the caption family command matched by _CAPTION_CMD_RE.
 
         Returns:
             (body_start, body_end, content, replacement_prefix)
             where replacement_prefix is text before body braces.
         """
         n = len(text)
-        if text.startswith("\\captionof", cmd_start):
-            cursor = cmd_start + len("\\captionof")
-            cursor = self._skip_whitespace(text, cursor)
-
+        cursor = match.end()
+        if match.group(1) == "of":
             # captionof requires first mandatory arg: {figure|table|...}
             _, type_end = self._parse_balanced_group(text, cursor, "{", "}")
             if type_end is None:
                 return None, None, None, None
             cursor = self._skip_whitespace(text, type_end)
-        elif text.startswith("\\caption*", cmd_start):
-            cursor = cmd_start + len("\\caption*")
-            cursor = self._skip_whitespace(text, cursor)
-        elif text.startswith("\\caption", cmd_start):
-            cursor = cmd_start + len("\\caption")
-            cursor = self._skip_whitespace(text, cursor)
-        else:
-            return None, None, None, None
 
         # Optional list entry argument (supports nested brackets)
         if cursor < n and text[cursor] == "[":
@@ -399,19 +537,22 @@ class LaTeXParser:
         if content is None or body_end is None:
             return None, None, None, None
 
-        replacement_prefix = text[cmd_start:cursor]
+        replacement_prefix = text[match.start() : cursor]
         return cursor, body_end, content, replacement_prefix
 
     def _extract_captions(self, text: str) -> str:
         """Extract caption content for translation before environment protection."""
+        # Also avoids building the no-scan ranges (a scan over every \begin)
+        if "\\caption" not in text:
+            return text
+
         no_scan_ranges = self._build_caption_no_scan_ranges(text)
-        command_pattern = re.compile(r"\\caption(?:of)?\*?(?![A-Za-z])")
 
         result = []
         pos = 0
         range_idx = 0
 
-        for match in command_pattern.finditer(text):
+        for match in _CAPTION_CMD_RE.finditer(text):
             cmd_start = match.start()
 
             while (
@@ -426,7 +567,7 @@ class LaTeXParser:
                     continue
 
             body_start, body_end, content, replacement_prefix = (
-                self._parse_caption_command_at(text, cmd_start)
+                self._parse_caption_command_at(text, match)
             )
             if (
                 body_start is None
@@ -440,15 +581,15 @@ class LaTeXParser:
 
             stripped = content.strip()
             is_existing_chunk_placeholder = bool(
-                re.fullmatch(r"\{\{CHUNK_[a-f0-9-]+\}\}", stripped)
-                or re.fullmatch(r"\{CHUNK_[a-f0-9-]+\}", stripped)
+                _CHUNK_PLACEHOLDER_RE.fullmatch(stripped)
+                or _SINGLE_BRACE_CHUNK_RE.fullmatch(stripped)
             )
             if (
                 stripped
                 and not stripped.startswith("[[")
                 and not is_existing_chunk_placeholder
             ):
-                chunk_id = str(uuid.uuid4())
+                chunk_id = self._next_chunk_id()
                 placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
                 chunk = Chunk(
                     id=chunk_id,
@@ -488,210 +629,157 @@ class LaTeXParser:
         return text
 
     def _protect_environments(self, text: str) -> str:
-        for env in self._protected_envs:
-            text = self._protect_single_environment(text, env)
-        return text
+        """Replace every protected environment with an [[ENV_n]] placeholder.
 
-    # Backward-compatible alias for existing internal/external calls.
-    def _protect_math_environments(self, text: str) -> str:
-        return self._protect_environments(text)
-
-    def _protect_single_environment(self, text: str, env: str) -> str:
-        begin_pattern = re.compile(r"(\\begin\{" + re.escape(env) + r"\})")
+        All environment names are matched in a single scan; the outermost
+        environment wins, so protected environments nested inside it stay
+        part of its placeholder value.
+        """
+        begin_pattern = _env_begin_re(frozenset(self._protected_envs))
         result = []
         pos = 0
+        search_pos = 0
 
-        for match in begin_pattern.finditer(text):
-            result.append(text[pos : match.start()])
-            start = match.start()
-            env_count = 1
-            i = match.end()
-
-            while i < len(text) and env_count > 0:
-                if text[i:].startswith(r"\begin{" + env + "}"):
-                    env_count += 1
-                    i += len(r"\begin{" + env + "}")
-                elif text[i:].startswith(r"\end{" + env + "}"):
-                    env_count -= 1
-                    if env_count == 0:
-                        i += len(r"\end{" + env + "}")
-                        break
-                    else:
-                        i += len(r"\end{" + env + "}")
-                else:
-                    i += 1
+        while True:
+            match = begin_pattern.search(text, search_pos)
+            if match is None:
+                break
 
-            if env_count == 0:
-                full_env = text[start:i]
-                self.protected_counter += 1
-                placeholder = f"[[ENV_{self.protected_counter}]]"
-                self.placeholder_map[placeholder] = full_env
-                result.append(placeholder)
-                pos = i
-            else:
-                result.append(match.group(0))
-                pos = match.end()
+            end = self._find_matching_end_tag(text, match.end(), match.group(1))
+            if end is None:
+                # Unbalanced environment, keep the original text
+                search_pos = match.end()
+                continue
+
+            result.append(text[pos : match.start()])
+            self.protected_counter += 1
+            placeholder = f"[[ENV_{self.protected_counter}]]"
+            self.placeholder_map[placeholder] = text[match.start() : end]
+            result.append(placeholder)
+            pos = search_pos = end
 
         result.append(text[pos:])
         return "".join(result)
 
-    def _protect_inline_math(self, text: str) -> str:
-        result = []
-        i = 0
-        n = len(text)
-
-        while i < n:
-            if i < n - 1 and text[i] == "\\" and text[i + 1] == "$":
-                result.append(text[i : i + 2])
-                i += 2
-                continue
+    # Backward-compatible alias for existing internal/external calls.
+    def _protect_math_environments(self, text: str) -> str:
+        return self._protect_environments(text)
 
-            if text[i] == "$":
-                is_display = i + 1 < n and text[i + 1] == "$"
-                delim = "$$" if is_display else "$"
-                start = i
-                i += len(delim)
-
-                while i < n:
-                    if text[i] == "\\" and i + 1 < n and text[i + 1] == "$":
-                        i += 2
-                        continue
-                    if is_display and i + 1 < n and text[i : i + 2] == "$$":
-                        i += 2
-                        break
-                    if not is_display and text[i] == "$":
-                        i += 1
-                        break
-                    i += 1
-
-                math_content = text[start:i]
-                if "\n\n" not in math_content:
-                    self.protected_counter += 1
-                    placeholder = f"[[MATH_{self.protected_counter}]]"
-                    self.placeholder_map[placeholder] = math_content
-                    result.append(placeholder)
-                else:
-                    result.append(math_content)
+    def _find_matching_end_tag(
+        self, text: str, search_start: int, env: str
+    ) -> Optional[int]:
+        """Index just past the \\end{env} closing the environment, or None."""
+        depth = 1
+        for tag in _env_tag_re(env).finditer(text, search_start):
+            if tag.group(1) == "begin":
+                depth += 1
             else:
-                result.append(text[i])
-                i += 1
-
-        text = "".join(result)
+                depth -= 1
+                if depth == 0:
+                    return tag.end()
+        return None
 
-        text = self._protect_display_math_delimiters(text, r"\[", r"\]")
-        text = self._protect_display_math_delimiters(text, r"\(", r"\)")
-        return text
+    def _protect_inline_math(self, text: str) -> str:
+        """Protect $...$ and $$...$$ spans, then \\[...\\] and \\(...\\).
 
-    def _protect_display_math_delimiters(
-        self, text: str, open_delim: str, close_delim: str
-    ) -> str:
-        open_escaped = re.escape(open_delim)
-        pattern = re.compile(r"(" + open_escaped + r")")
+        Only delimiters are visited (via finditer), so text between them is
+        copied in slices. An escaped \\$ never opens or closes a span; a span
+        containing a blank line is left as-is.
+        """
         result = []
         pos = 0
+        search_pos = 0
+
+        while True:
+            match = _DOLLAR_RE.search(text, search_pos)
+            if match is None:
+                break
+            if match.group() != "$":
+                # Escaped \$
+                search_pos = match.end()
+                continue
 
-        for match in pattern.finditer(text):
-            result.append(text[pos : match.start()])
             start = match.start()
-            i = match.end()
-            delim_len = len(open_delim)
-
-            while i < len(text):
-                if text[i : i + len(close_delim)] == close_delim:
-                    i += len(close_delim)
-                    full_math = text[start:i]
-                    self.protected_counter += 1
-                    placeholder = f"[[MATH_{self.protected_counter}]]"
-                    self.placeholder_map[placeholder] = full_math
-                    result.append(placeholder)
-                    pos = i
+            delim = "$$" if text.startswith("$$", start) else "$"
+            close_re = _DOUBLE_DOLLAR_RE if delim == "$$" else _DOLLAR_RE
+            # An unterminated span runs to the end of the text
+            end = len(text)
+            for close in close_re.finditer(text, start + len(delim)):
+                if close.group() == delim:
+                    end = close.end()
                     break
-                i += 1
-            else:
-                result.append(match.group(0))
-                pos = match.end()
 
-        result.append(text[pos:])
-        return "".join(result)
+            search_pos = end
+            math_content = text[start:end]
+            if "\n\n" in math_content:
+                continue
 
-    def _protect_commands(self, text: str) -> str:
-        commands_with_brace_counting = [
-            ("cite", "CITE"),
-            ("ref", "REF"),
-            ("eqref", "REF"),
-            ("label", "LABEL"),
-            ("url", "URL"),
-            ("href", "HREF"),
-        ]
-        for cmd, prefix in commands_with_brace_counting:
-            text = self._protect_nested_command(text, cmd, prefix)
+            result.append(text[pos:start])
+            self.protected_counter += 1
+            placeholder = f"[[MATH_{self.protected_counter}]]"
+            self.placeholder_map[placeholder] = math_content
+            result.append(placeholder)
+            pos = end
 
-        text = self._protect_includegraphics(text)
+        result.append(text[pos:])
+        text = "".join(result)
 
-        return text
+        return self._protect_display_math(text)
 
-    def _protect_includegraphics(self, text: str) -> str:
-        pattern = re.compile(r"(\\includegraphics(?:\[[^\]]*\])?\s*\{)")
+    def _protect_display_math(self, text: str) -> str:
+        """Protect \\[...\\] and \\(...\\) spans in a single pass."""
         result = []
         pos = 0
+        search_pos = 0
+
+        while True:
+            match = _DISPLAY_MATH_OPEN_RE.search(text, search_pos)
+            if match is None:
+                break
+
+            close_delim = _DISPLAY_MATH_CLOSE[match.group()]
+            close_idx = text.find(close_delim, match.end())
+            if close_idx == -1:
+                search_pos = match.end()
+                continue
 
-        for match in pattern.finditer(text):
+            end = close_idx + len(close_delim)
             result.append(text[pos : match.start()])
-            start = match.end()
-            brace_count = 1
-            i = start
-
-            while i < len(text) and brace_count > 0:
-                if text[i] == "{":
-                    brace_count += 1
-                elif text[i] == "}":
-                    brace_count -= 1
-                i += 1
-
-            if brace_count == 0:
-                full_command = match.group(0) + text[start:i]
-                self.protected_counter += 1
-                placeholder = f"[[GRAPHICS_{self.protected_counter}]]"
-                self.placeholder_map[placeholder] = full_command
-                result.append(placeholder)
-                pos = i
-            else:
-                result.append(match.group(0))
-                pos = match.end()
+            self.protected_counter += 1
+            placeholder = f"[[MATH_{self.protected_counter}]]"
+            self.placeholder_map[placeholder] = text[match.start() : end]
+            result.append(placeholder)
+            pos = search_pos = end
 
         result.append(text[pos:])
         return "".join(result)
 
-    def _protect_nested_command(self, text: str, cmd: str, prefix: str) -> str:
-        """Protect commands that may contain nested braces using brace counting."""
-        pattern = re.compile(r"(\\" + cmd + r"\s*\{)")
+    def _protect_commands(self, text: str) -> str:
+        """Protect references, links and graphics in a single scan.
+
+        Arguments are brace-counted so nested braces are kept whole; a
+        protected command nested inside another stays part of the outer one.
+        """
         result = []
         pos = 0
 
-        for match in pattern.finditer(text):
-            result.append(text[pos : match.start()])
+        for match in _PROTECTED_COMMAND_RE.finditer(text):
+            if match.start() < pos:
+                continue
             start = match.end()
-            brace_count = 1
-            i = start
-
-            while i < len(text) and brace_count > 0:
-                if text[i] == "{":
-                    brace_count += 1
-                elif text[i] == "}":
-                    brace_count -= 1
-                i += 1
-
-            if brace_count == 0:
-                full_command = match.group(0) + text[start:i]
-                self.protected_counter += 1
-                placeholder = f"[[{prefix}_{self.protected_counter}]]"
-                self.placeholder_map[placeholder] = full_command
-                result.append(placeholder)
-                pos = i
-            else:
+            i = self._find_closing_brace(text, start)
+            if i is None:
                 # Unbalanced braces, keep original
-                result.append(match.group(0))
-                pos = match.end()
+                continue
+
+            name = match.group(1)
+            prefix = _PROTECTED_COMMAND_PREFIXES.get(name, "GRAPHICS")
+            result.append(text[pos : match.start()])
+            self.protected_counter += 1
+            placeholder = f"[[{prefix}_{self.protected_counter}]]"
+            self.placeholder_map[placeholder] = text[match.start() : i]
+            result.append(placeholder)
+            pos = i
 
         result.append(text[pos:])
         return "".join(result)
@@ -711,31 +799,31 @@ class LaTeXParser:
 
         return pattern.sub(replacer, text)
 
-    def _extract_section_command(self, text: str, cmd: str) -> str:
-        """Extract section commands with brace counting to handle nested braces."""
-        pattern = re.compile(r"(\\" + cmd + r")(\*?)(\s*\{)")
+    def _extract_section_commands(self, text: str) -> str:
+        """Extract section commands with brace counting to handle nested braces.
+
+        All SECTION_COMMANDS are matched in one scan; a command nested inside
+        another's title stays part of the outer chunk.
+        """
         result = []
         pos = 0
 
-        for match in pattern.finditer(text):
+        for match in _section_commands_re(frozenset(self.SECTION_COMMANDS)).finditer(
+            text
+        ):
+            if match.start() < pos:
+                continue
+            cmd = match.group(1)
             result.append(text[pos : match.start()])
             start = match.end()
-            brace_count = 1
-            i = start
-
-            while i < len(text) and brace_count > 0:
-                if text[i] == "{":
-                    brace_count += 1
-                elif text[i] == "}":
-                    brace_count -= 1
-                i += 1
+            i = self._find_closing_brace(text, start)
 
-            if brace_count == 0:
+            if i is not None:
                 content = text[start : i - 1]
                 if not content.strip() or content.startswith("[["):
                     result.append(match.group(0) + content + "}")
                 else:
-                    chunk_id = str(uuid.uuid4())
+                    chunk_id = self._next_chunk_id()
                     placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
                     chunk = Chunk(
                         id=chunk_id,
@@ -745,13 +833,7 @@ class LaTeXParser:
                         preserved_elements={},
                     )
                     self.chunks.append(chunk)
-                    result.append(
-                        match.group(1)
-                        + match.group(2)
-                        + match.group(3)
-                        + placeholder
-                        + "}"
-                    )
+                    result.append(match.group(0) + placeholder + "}")
                 pos = i
                 # If trailing body text exists on same line after section
                 # command's closing brace, insert newline so _chunk_paragraphs
@@ -769,11 +851,8 @@ class LaTeXParser:
         return "".join(result)
 
     def _extract_translatable_text(self, text: str) -> str:
-        for cmd in self.SECTION_COMMANDS:
-            text = self._extract_section_command(text, cmd)
-
-        for env in self.TRANSLATABLE_ENVIRONMENTS:
-            text = self._extract_translatable_environment(text, env)
+        text = self._extract_section_commands(text)
+        text = self._extract_translatable_environments(text)
 
         text, footnote_chunks = self._extract_footnote_commands(text)
         text = self._chunk_paragraphs(text)
@@ -811,12 +890,14 @@ class LaTeXParser:
 
     def _extract_footnote_commands(self, text: str) -> Tuple[str, List[Chunk]]:
         """Extract \\footnote{...} as translatable chunks."""
-        command_pattern = re.compile(r"\\footnote(?![A-Za-z])")
+        if "\\footnote" not in text:
+            return text, []
+
         result = []
         pos = 0
         created_chunks: List[Chunk] = []
 
-        for match in command_pattern.finditer(text):
+        for match in _FOOTNOTE_CMD_RE.finditer(text):
             cmd_start = match.start()
             body_start, body_end, content, wrapper_prefix = (
                 self._parse_footnote_command_at(text, cmd_start)
@@ -833,15 +914,15 @@ class LaTeXParser:
 
             stripped = content.strip()
             is_existing_chunk_placeholder = bool(
-                re.fullmatch(r"\{\{CHUNK_[a-f0-9-]+\}\}", stripped)
-                or re.fullmatch(r"\{CHUNK_[a-f0-9-]+\}", stripped)
+                _CHUNK_PLACEHOLDER_RE.fullmatch(stripped)
+                or _SINGLE_BRACE_CHUNK_RE.fullmatch(stripped)
             )
             if (
                 stripped
                 and not stripped.startswith("[[")
                 and not is_existing_chunk_placeholder
             ):
-                chunk_id = str(uuid.uuid4())
+                chunk_id = self._next_chunk_id()
                 placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
                 chunk = Chunk(
                     id=chunk_id,
@@ -864,54 +945,43 @@ class LaTeXParser:
     def _extract_translatable_content(self, text: str) -> str:
         return self._extract_translatable_text(text)
 
-    def _extract_translatable_environment(self, text: str, env: str) -> str:
-        begin_pattern = re.compile(r"(\\begin\{" + re.escape(env) + r"\})")
+    def _extract_translatable_environments(self, text: str) -> str:
+        """Turn the body of each TRANSLATABLE_ENVIRONMENTS block into a chunk.
+
+        All environments are matched in one scan; the outermost one wins.
+        """
+        begin_pattern = _env_begin_re(frozenset(self.TRANSLATABLE_ENVIRONMENTS))
         result = []
         pos = 0
 
         for match in begin_pattern.finditer(text):
             if match.start() < pos:
                 continue
+            env = match.group(1)
+            end = self._find_matching_end_tag(text, match.end(), env)
+            if end is None:
+                continue
+
+            begin_tag = match.group(0)
+            end_tag = r"\end{" + env + "}"
+            content = text[match.end() : end - len(end_tag)]
             result.append(text[pos : match.start()])
-            begin_tag = match.group(1)
-            start = match.end()
-            env_count = 1
-            i = start
-
-            while i < len(text) and env_count > 0:
-                if text[i:].startswith(r"\begin{" + env + "}"):
-                    env_count += 1
-                    i += len(r"\begin{" + env + "}")
-                elif text[i:].startswith(r"\end{" + env + "}"):
-                    env_count -= 1
-                    if env_count == 0:
-                        end_tag = r"\end{" + env + "}"
-                        i += len(end_tag)
-                        content = text[start : i - len(end_tag)]
-
-                        if content.strip():
-                            chunk_id = str(uuid.uuid4())
-                            placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
-                            chunk = Chunk(
-                                id=chunk_id,
-                                content=content.strip(),
-                                latex_wrapper="%s",
-                                context=env,
-                                preserved_elements={},
-                            )
-                            self.chunks.append(chunk)
-                            result.append(f"{begin_tag}\n{placeholder}\n{end_tag}")
-                        else:
-                            result.append(match.group(0) + content + end_tag)
-                        pos = i
-                        break
-                    else:
-                        i += len(r"\end{" + env + "}")
-                else:
-                    i += 1
+
+            if content.strip():
+                chunk_id = self._next_chunk_id()
+                placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
+                chunk = Chunk(
+                    id=chunk_id,
+                    content=content.strip(),
+                    latex_wrapper="%s",
+                    context=env,
+                    preserved_elements={},
+                )
+                self.chunks.append(chunk)
+                result.append(f"{begin_tag}\n{placeholder}\n{end_tag}")
             else:
-                result.append(match.group(0))
-                pos = match.end()
+                result.append(text[match.start() : end])
+            pos = end
 
         result.append(text[pos:])
         return "".join(result)
@@ -929,7 +999,7 @@ class LaTeXParser:
             if not content.strip() or content.startswith("[["):
                 return match.group(0)
 
-            chunk_id = str(uuid.uuid4())
+            chunk_id = self._next_chunk_id()
             placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
 
             chunk = Chunk(
@@ -958,7 +1028,7 @@ class LaTeXParser:
             if not content.strip():
                 return match.group(0)
 
-            chunk_id = str(uuid.uuid4())
+            chunk_id = self._next_chunk_id()
             placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
 
             chunk = Chunk(
@@ -977,138 +1047,192 @@ class LaTeXParser:
     def _chunk_paragraphs(self, text: str) -> str:
         lines = text.split("\n")
         result_lines = []
-        current_para = []
+        # (index in result_lines, paragraph text), decided in one batch below
+        paragraphs: List[Tuple[int, str]] = []
+        # Index of the first line of the paragraph being collected
+        para_start = None
 
-        for line in lines:
+        for idx, line in enumerate(lines):
             stripped = line.strip()
 
-            if self._is_structural_line(stripped):
-                if current_para:
-                    para_text = "\n".join(current_para)
-                    result_lines.append(self._maybe_chunk_paragraph(para_text))
-                    current_para = []
-                result_lines.append(line)
-            elif stripped == "":
-                if current_para:
-                    para_text = "\n".join(current_para)
-                    result_lines.append(self._maybe_chunk_paragraph(para_text))
-                    current_para = []
-                result_lines.append(line)
-            else:
-                current_para.append(line)
+            # Every structural pattern starts with one of a few characters,
+            # so most prose lines are settled without running the regex.
+            if stripped and not (
+                stripped[0] in _STRUCTURAL_FIRST_CHARS
+                and self._is_structural_line(stripped)
+            ):
+                if para_start is None:
+                    para_start = idx
+                continue
+
+            if para_start is not None:
+                paragraphs.append((len(result_lines), "\n".join(lines[para_start:idx])))
+                result_lines.append("")
+                para_start = None
+            result_lines.append(line)
+
+        if para_start is not None:
+            paragraphs.append((len(result_lines), "\n".join(lines[para_start:])))
+            result_lines.append("")
 
-        if current_para:
-            para_text = "\n".join(current_para)
-            result_lines.append(self._maybe_chunk_paragraph(para_text))
+        chunked = self._chunk_paragraph_batch([para for _, para in paragraphs])
+        for (slot, _), replacement in zip(paragraphs, chunked):
+            result_lines[slot] = replacement
 
         return "\n".join(result_lines)
 
     def _is_structural_line(self, line: str) -> bool:
-        structural_patterns = [
-            r"^\\begin\{",
-            r"^\\end\{",
-            r"^\\section",
-            r"^\\subsection",
-            r"^\\subsubsection",
-            r"^\\paragraph",
-            r"^\\subparagraph",
-            r"^\\chapter",
-            r"^\\part",
-            r"^\\title",
-            r"^\\author",
-            r"^\\maketitle",
-            r"^\\bibliographystyle",
-            r"^\\bibliography",
-            r"^\\tableofcontents",
-            r"^\\listoffigures",
-            r"^\\listoftables",
-            r"^\\newpage",
-            r"^\\clearpage",
-            r"^\\balance",
-            r"^%",
-            r"^\s*\\item",
-            r"^\s*\\caption",
-            r"^\s*\\centering",
-            r"^\s*\\label",
-            r"^\s*\[(?!\[)",
-            r"^\s*\](?!\])",
-            r"^\\toprule",
-            r"^\\midrule",
-            r"^\\bottomrule",
-            r"^\\hline",
-            r"^\s*&",
-            r"\\\\\s*$",
-        ]
-        for pattern in structural_patterns:
-            if re.match(pattern, line):
-                return True
-        return False
+        if line.startswith(_STRUCTURAL_PREFIXES):
+            return True
+        indented = line.lstrip()
+        if indented.startswith(_STRUCTURAL_INDENTED_PREFIXES):
+            return True
+        # Optional-argument brackets on their own line, but not placeholders
+        if indented.startswith("[") and not indented.startswith("[["):
+            return True
+        if indented.startswith("]") and not indented.startswith("]]"):
+            return True
+        # A line consisting only of a line break
+        return line.startswith("\\\\") and not line[2:].strip()
 
     def _maybe_chunk_paragraph(self, para_text: str) -> str:
-        if is_placeholder_only(para_text):
-            return para_text
+        return self._chunk_paragraph_batch([para_text])[0]
 
-        text_content = para_text
-        for placeholder in re.findall(r"\[\[[A-Z_]+_\d+\]\]", para_text):
-            text_content = text_content.replace(placeholder, "")
-        for placeholder in re.findall(r"\{\{CHUNK_[a-f0-9-]+\}\}", para_text):
-            text_content = text_content.replace(placeholder, "")
+    def _chunk_paragraph_batch(self, paragraphs: List[str]) -> List[str]:
+        """Replace each paragraph with enough prose by a chunk placeholder.
 
-        clean_text = re.sub(
-            r"\\[a-zA-Z]+\*?(?:\[[^\]]*\])?(?:\{[^}]*\})*", "", text_content
-        )
-        clean_text = re.sub(r"[{}\[\]\\]", "", clean_text)
-        clean_text = clean_text.strip()
-
-        if len(clean_text) < 20:
-            return para_text
+        The cleanup regexes run once over all candidates joined by
+        _PARAGRAPH_SEP rather than once per paragraph.
+        """
+        result = list(paragraphs)
+        # Cleanup only removes characters, so a paragraph that is already
+        # shorter than the threshold can never qualify.
+        candidates = [
+            i
+            for i, para in enumerate(paragraphs)
+            if len(para) >= 20 and not is_placeholder_only(para)
+        ]
+        if not candidates:
+            return result
+
+        joined = _PARAGRAPH_SEP.join(paragraphs[i] for i in candidates)
+        cleaned = _CLEAN_RE.sub("", _ANY_PLACEHOLDER_RE.sub("", joined))
+        cleaned_parts = cleaned.split(_PARAGRAPH_SEP)
+        if len(cleaned_parts) != len(candidates):
+            # A paragraph contained the separator itself; clean one by one
+            cleaned_parts = [
+                _CLEAN_RE.sub("", _ANY_PLACEHOLDER_RE.sub("", paragraphs[i]))
+                for i in candidates
+            ]
 
-        chunk_id = str(uuid.uuid4())
-        placeholder = f"{{{{CHUNK_{chunk_id}}}}}"
+        for i, clean_text in zip(candidates, cleaned_parts):
+            if len(clean_text.strip()) < 20:
+                continue
 
-        chunk = Chunk(
-            id=chunk_id,
-            content=para_text.strip(),
-            latex_wrapper="%s",
-            context="paragraph",
-            preserved_elements={},
-        )
-        self.chunks.append(chunk)
+            chunk_id = self._next_chunk_id()
+            chunk = Chunk(
+                id=chunk_id,
+                content=paragraphs[i].strip(),
+                latex_wrapper="%s",
+                context="paragraph",
+                preserved_elements={},
+            )
+            self.chunks.append(chunk)
+            result[i] = f"{{{{CHUNK_{chunk_id}}}}}"
 
-        return placeholder
+        return result
 
     def _flatten_latex(self, content: str, base_dir: str) -> str:
-        def replace_input(match):
+        """Inline \\input/\\include targets, recursively.
+
+        Uses an explicit stack instead of recursion. Each included file is read
+        and flattened once per call; repeated includes reuse the result, and
+        an include cycle leaves the offending directive unexpanded.
+        """
+        if not _has_include_directive(content):
+            return content
+
+        flattened: Dict[str, str] = {}
+        stack = [_FlattenFrame(content, base_dir)]
+
+        while True:
+            frame = stack[-1]
+            match = next(frame.matches, None)
+
+            if match is None:
+                frame.out.append(frame.content[frame.pos :])
+                result = "".join(frame.out)
+                stack.pop()
+                if not stack:
+                    return result
+                flattened[frame.path] = result
+                stack[-1].out.append(result)
+                continue
+
+            frame.out.append(frame.content[frame.pos : match.start()])
+            frame.pos = match.end()
             prefix = match.group(1)  # 保留前导字符（换行符或非%字符）
             filename = match.group(3)
-            target_path = self._resolve_path(base_dir, filename)
-
-            if target_path and os.path.exists(target_path):
-                try:
-                    with open(target_path, "r", encoding="utf-8") as f:
-                        sub_content = f.read()
-                    sub_dir = os.path.dirname(target_path)
-                    return prefix + self._flatten_latex(sub_content, sub_dir)
-                except Exception as e:
-                    print(f"Warning: Could not read included file {target_path}: {e}")
-                    return match.group(0)
-            else:
-                print(f"Warning: Included file not found: {filename} in {base_dir}")
-                return match.group(0)
+            target_path = self._resolve_path(frame.base_dir, filename)
 
-        pattern = re.compile(r"(^|[^%])\\(input|include)\{([^}]+)\}")
-        return pattern.sub(replace_input, content)
+            if not target_path:
+                print(
+                    f"Warning: Included file not found: {filename} in {frame.base_dir}"
+                )
+                frame.out.append(match.group(0))
+                continue
+
+            if target_path in flattened:
+                frame.out.append(prefix + flattened[target_path])
+                continue
+
+            if any(f.path == target_path for f in stack):
+                print(f"Warning: Circular include skipped: {target_path}")
+                frame.out.append(match.group(0))
+                continue
+
+            try:
+                with open(target_path, "r", encoding="utf-8") as f:
+                    sub_content = f.read()
+            except Exception as e:
+                print(f"Warning: Could not read included file {target_path}: {e}")
+                frame.out.append(match.group(0))
+                continue
+
+            frame.out.append(prefix)
+            if _has_include_directive(sub_content):
+                stack.append(
+                    _FlattenFrame(sub_content, os.path.dirname(target_path), target_path)
+                )
+            else:
+                flattened[target_path] = sub_content
+                frame.out.append(sub_content)
 
     def _resolve_path(self, base_dir: str, filename: str) -> Optional[str]:
         candidates = [filename]
         if not filename.lower().endswith(".tex"):
             candidates.append(filename + ".tex")
         for cand in candidates:
-            path = os.path.join(base_dir, cand)
-            if os.path.exists(path):
+            # Normalised so "a/../b" and "b" share one cache entry in
+            # _flatten_latex and its cycle check
+            path = os.path.normpath(os.path.join(base_dir, cand))
+            if self._path_exists(path):
                 return path
         return None
 
+    def _path_exists(self, path: str) -> bool:
+        """os.path.exists backed by one cached directory listing per directory."""
+        directory, name = os.path.split(path)
+        entries = self._dir_entries.get(directory)
+        if entries is None:
+            try:
+                with os.scandir(directory or ".") as it:
+                    entries = {entry.name for entry in it}
+            except OSError:
+                entries = set()
+            self._dir_entries[directory] = entries
+        return name in entries
+
     def _resolve_bibliography(self, text: str, base_dir: str) -> str:
         r"""Resolve bibliography commands to use .bbl files when .bib is absent.
 
@@ -1125,9 +1249,16 @@ class LaTeXParser:
         Returns:
             Modified text with bibliography commands resolved
         """
+        # Literal pre-check, as in _flatten_latex: most sources have no
+        # \bibliography command (or it was already inlined)
+        if "\\bibliography{" not in text:
+            return text
+
+        replaced = False
 
         def process_bibliography_match(match):
             """Process a single \bibliography{} match."""
+            nonlocal replaced
             full_match = match.group(0)
             names_str = match.group(1)
 
@@ -1145,9 +1276,9 @@ class LaTeXParser:
                 bib_path = os.path.join(base_dir, f"{name}.bib")
                 bbl_path = os.path.join(base_dir, f"{name}.bbl")
 
-                if os.path.exists(bib_path):
+                if self._path_exists(bib_path):
                     has_bib = True
-                if os.path.exists(bbl_path):
+                if self._path_exists(bbl_path):
                     has_bbl = True
 
             # If any .bib exists, keep original
@@ -1157,17 +1288,19 @@ class LaTeXParser:
             # If no .bib but has .bbl, replace with input commands
             if has_bbl and not has_bib:
                 input_commands = [f"\\input{{{name}.bbl}}" for name in names]
+                replaced = True
                 return "\n".join(input_commands)
 
             # Neither file exists: keep original (graceful fallback)
             return full_match
 
         # Process bibliography commands
-        result = re.sub(r"\\bibliography\{([^}]+)\}", process_bibliography_match, text)
+        result = _BIBLIOGRAPHY_RE.sub(process_bibliography_match, text)
 
-        # Remove \bibliographystyle{} lines only if we replaced bibliography commands
-        if result != text:
-            result = re.sub(r"\\bibliographystyle\{[^}]+\}\n?", "", result)
+        # Remove \bibliographystyle{} lines only if we replaced bibliography
+        # commands (tracked by the callback, not by comparing whole strings)
+        if replaced:
+            result = _BIBLIOGRAPHYSTYLE_RE.sub("", result)
 
         return result
 
@@ -1183,21 +1316,28 @@ class LaTeXParser:
         lines = content.split("\n")
         result = []
         in_verbatim = False
-        verbatim_envs = {"verbatim", "lstlisting", "minted", "comment"}
+        # 全文没有 verbatim 类环境时无需逐行检测
+        track_verbatim = _VERBATIM_TAG_RE.search(content) is not None
 
         for line in lines:
-            # 检测 verbatim 环境的开始/结束
-            for env in verbatim_envs:
-                if f"\\begin{{{env}}}" in line:
-                    in_verbatim = True
-                if f"\\end{{{env}}}" in line:
+            # 检测 verbatim 环境的开始/结束（同一行同时出现时以结束为准）
+            if track_verbatim and ("\\begin{" in line or "\\end{" in line):
+                tokens = {m.group(1) for m in _VERBATIM_TAG_RE.finditer(line)}
+                if "end" in tokens:
                     in_verbatim = False
+                elif tokens:
+                    in_verbatim = True
 
             # verbatim 环境内保持原样
             if in_verbatim:
                 result.append(line)
                 continue
 
+            # 不含 % 的行只需去掉行尾空白
+            if "%" not in line:
+                result.append(line.rstrip())
+                continue
+
             # 保留编译器指令（%!TEX, %!BIB 等）
             stripped = line.lstrip()
             if stripped.startswith("%!"):
@@ -1209,7 +1349,7 @@ class LaTeXParser:
                 continue
 
             # 行尾注释：删除 % 及其后内容（但保留 \%）
-            cleaned = re.sub(r"(?<!\\)%.*$", "", line)
+            cleaned = _TRAILING_COMMENT_RE.sub("", line)
 
             # 保留非空行或原本就是空行
             if cleaned.strip() or not line.strip():
@@ -1218,9 +1358,9 @@ class LaTeXParser:
         return "\n".join(result)
 
     def _split_preamble_body(self, content: str) -> Tuple[str, str]:
-        match = re.search(r"\\begin\{document\}", content)
-        if match:
-            end_idx = match.end()
+        begin_idx = content.find(_BEGIN_DOCUMENT)
+        if begin_idx != -1:
+            end_idx = begin_idx + len(_BEGIN_DOCUMENT)
             preamble = content[:end_idx]
             body = content[end_idx:]
             return preamble, body
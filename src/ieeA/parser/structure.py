@@ -2,14 +2,31 @@ import json
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 import uuid
 
+# Translations keyed by chunk id, or an in-order list aligned with doc.chunks
+# (None entries fall back to the original chunk content).
+TranslatedChunks = Union[Dict[str, str], Sequence[Optional[str]]]
 
-@dataclass
+# Generated placeholders are ASCII; re.ASCII keeps \d to 0-9
+_PLACEHOLDER_RE = re.compile(r"\[\[[A-Z_]+_\d+\]\]", re.ASCII)
+# Placeholders skipped by escape_latex_special_chars: [[...]] or {{CHUNK_...}}
+_ESCAPE_PLACEHOLDER_RE = re.compile(r"(\[\[[^\]]+\]\]|\{\{CHUNK_[a-f0-9-]+\}\})")
+# %, & or # not already escaped
+_UNESCAPED_SPECIAL_RE = re.compile(r"(?<!\\)([%&#])")
+# Any [[...]] token, looked up in a placeholder dict during reconstruction
+_BRACKET_TOKEN_RE = re.compile(r"\[\[[^\[\]]+\]\]")
+# {{CHUNK_<id>}}; group 1 is the chunk id
+_CHUNK_TOKEN_RE = re.compile(r"\{\{CHUNK_([^{}]+)\}\}")
+
+
+@dataclass(slots=True)
 class Chunk:
     """
     Represents a translatable unit of text from a LaTeX document.
+
+    Uses __slots__: documents can produce thousands of chunks.
     """
 
     id: str
@@ -58,7 +75,7 @@ class LaTeXDocument:
 
     def _reconstruct_internal(
         self,
-        translated_chunks: Optional[Dict[str, str]] = None,
+        translated_chunks: Optional[TranslatedChunks] = None,
         collect_chunk_start_lines: bool = False,
     ) -> Tuple[str, Dict[str, int]]:
         preamble_result = self.preamble
@@ -67,41 +84,23 @@ class LaTeXDocument:
 
         full_result = preamble_result + body_result
 
-        max_iterations = 10
-        for _ in range(max_iterations):
-            replacements_made = False
-            for placeholder, original in self.global_placeholders.items():
-                if placeholder in full_result:
-                    full_result = full_result.replace(placeholder, original)
-                    replacements_made = True
-            if not replacements_made:
-                break
-
-        for chunk in self.chunks:
-            placeholder = f"{{{{CHUNK_{chunk.id}}}}}"
-            if placeholder in full_result:
-                trans_text = (
-                    translated_chunks.get(chunk.id) if translated_chunks else None
-                )
-                reconstructed = chunk.reconstruct(trans_text)
-                if collect_chunk_start_lines:
-                    start_marker = f"__IEEA_CHUNK_START_{chunk.id}__"
-                    end_marker = f"__IEEA_CHUNK_END_{chunk.id}__"
-                    reconstructed = f"{start_marker}{reconstructed}{end_marker}"
-                full_result = full_result.replace(placeholder, reconstructed)
+        full_result = self._restore_global_placeholders(full_result)
+        full_result = self._restore_chunks(
+            full_result, translated_chunks, collect_chunk_start_lines
+        )
 
+        # Leftover chunk-level placeholders, in one pass; the first chunk
+        # that defines a placeholder wins, as with replacing in chunk order.
+        preserved: Dict[str, str] = {}
         for chunk in self.chunks:
             for placeholder, original in chunk.preserved_elements.items():
-                full_result = full_result.replace(placeholder, original)
-
-        for _ in range(max_iterations):
-            replacements_made = False
-            for placeholder, original in self.global_placeholders.items():
-                if placeholder in full_result:
-                    full_result = full_result.replace(placeholder, original)
-                    replacements_made = True
-            if not replacements_made:
-                break
+                preserved.setdefault(placeholder, original)
+        if preserved:
+            full_result = _BRACKET_TOKEN_RE.sub(
+                lambda m: preserved.get(m.group(), m.group()), full_result
+            )
+
+        full_result = self._restore_global_placeholders(full_result)
 
         if collect_chunk_start_lines:
             for chunk in self.chunks:
@@ -119,7 +118,87 @@ class LaTeXDocument:
 
         return full_result, chunk_start_lines
 
-    def reconstruct(self, translated_chunks: Optional[Dict[str, str]] = None) -> str:
+    def _restore_global_placeholders(self, text: str) -> str:
+        """Replace global placeholders, repeating for nested ones.
+
+        Each round is one regex pass with dict lookups instead of a scan per
+        placeholder; it stops once a round finds nothing (at most 10 rounds).
+        """
+        table = self.global_placeholders
+        if not table:
+            return text
+
+        found = False
+
+        def lookup(match: re.Match) -> str:
+            nonlocal found
+            original = table.get(match.group())
+            if original is None:
+                return match.group()
+            found = True
+            return original
+
+        for _ in range(10):
+            found = False
+            text = _BRACKET_TOKEN_RE.sub(lookup, text)
+            if not found:
+                break
+        return text
+
+    def _restore_chunks(
+        self,
+        text: str,
+        translated_chunks: Optional[TranslatedChunks],
+        collect_chunk_start_lines: bool,
+    ) -> str:
+        """Replace {{CHUNK_<id>}} placeholders with reconstructed chunks.
+
+        Placeholders are dispatched by id in one regex pass. A chunk's output
+        is only searched for chunks that come after it in self.chunks, which
+        matches replacing the chunks one by one in order.
+        """
+        # Ascending indices per id (ids are normally unique)
+        indices_by_id: Dict[str, List[int]] = {}
+        for index, chunk in enumerate(self.chunks):
+            indices_by_id.setdefault(chunk.id, []).append(index)
+        by_id = isinstance(translated_chunks, dict)
+        resolved: Dict[int, str] = {}
+
+        def resolve(source: str, after: int) -> str:
+            def replace(match: re.Match) -> str:
+                indices = indices_by_id.get(match.group(1))
+                if indices is None:
+                    return match.group()
+                # The next chunk with this id that has not been replaced yet
+                index = next((i for i in indices if i > after), None)
+                if index is None:
+                    return match.group()
+                if index not in resolved:
+                    resolved[index] = resolve(build(index), index)
+                return resolved[index]
+
+            return _CHUNK_TOKEN_RE.sub(replace, source)
+
+        def build(index: int) -> str:
+            chunk = self.chunks[index]
+            if not translated_chunks:
+                trans_text = None
+            elif by_id:
+                trans_text = translated_chunks.get(chunk.id)
+            elif index < len(translated_chunks):
+                trans_text = translated_chunks[index]
+            else:
+                trans_text = None
+            reconstructed = chunk.reconstruct(trans_text)
+            if collect_chunk_start_lines:
+                start_marker = f"__IEEA_CHUNK_START_{chunk.id}__"
+                end_marker = f"__IEEA_CHUNK_END_{chunk.id}__"
+                reconstructed = f"{start_marker}{reconstructed}{end_marker}"
+            return reconstructed
+
+        return resolve(text, -1)
+
+    def reconstruct(self, translated_chunks: Optional[TranslatedChunks] = None) -> str:
         full_result, _ = self._reconstruct_internal(
             translated_chunks=translated_chunks,
             collect_chunk_start_lines=False,
@@ -127,7 +206,7 @@ class LaTeXDocument:
         return full_result
 
     def reconstruct_with_chunk_start_lines(
-        self, translated_chunks: Optional[Dict[str, str]] = None
+        self, translated_chunks: Optional[TranslatedChunks] = None
     ) -> Tuple[str, Dict[str, int]]:
         return self._reconstruct_internal(
             translated_chunks=translated_chunks,
@@ -207,32 +286,33 @@ def escape_latex_special_chars(text: str) -> str:
     Returns:
         Text with special characters properly escaped
     """
-    # Regex to match placeholders: [[...]] or {{CHUNK_...}}
-    placeholder_pattern = r"(\[\[[^\]]+\]\]|\{\{CHUNK_[a-f0-9-]+\}\})"
+    if "%" not in text and "&" not in text and "#" not in text:
+        return text
 
     # Split text into alternating segments: text/placeholder/text/placeholder...
-    segments = re.split(placeholder_pattern, text)
+    segments = _ESCAPE_PLACEHOLDER_RE.split(text)
 
     # Escape only even-indexed segments (text parts), skip odd-indexed (placeholders)
     escaped_segments = []
     for i, segment in enumerate(segments):
         if i % 2 == 0:
-            segment = re.sub(r"(?<!\\)%", r"\\%", segment)
-            segment = re.sub(r"(?<!\\)&", r"\\&", segment)
-            segment = re.sub(r"(?<!\\)#", r"\\#", segment)
+            segment = _UNESCAPED_SPECIAL_RE.sub(r"\\\1", segment)
         escaped_segments.append(segment)
 
     return "".join(escaped_segments)
 
 
 def validate_translated_placeholders(
-    translated_chunks: Dict[str, str],
+    translated_chunks: TranslatedChunks,
     doc: "LaTeXDocument",
     valid_placeholders: Optional[Set[str]] = None,
-) -> Tuple[Dict[str, str], List[Dict]]:
+) -> Tuple[TranslatedChunks, List[Dict]]:
     """
     校验并自动修复 LLM 翻译文本中的占位符问题。
 
+    translated_chunks 可以是 chunk_id → 译文的字典，也可以是与 doc.chunks
+    顺序对齐的列表；返回值与传入类型一致。
+
     - typo (编辑距离 ≤ 2): 自动替换为正确占位符
     - hallucination (编辑距离 > 2 或跨 chunk 引用): 从文本中删除
     - missing (源文本有但翻译中缺失): 仅记录警告，不修复
@@ -249,7 +329,7 @@ def validate_translated_placeholders(
     whitelist = {"[[SL]]", "[[PL]]", "[[SL_RAW]]", "[[PL_RAW]]"}
 
     # 3. 构建每个 chunk 源文本中的占位符映射
-    ph_pattern = re.compile(r"\[\[[A-Z_]+_\d+\]\]")
+    ph_pattern = _PLACEHOLDER_RE
 
     source_ph_map: Dict[str, Set[str]] = {}
     chunk_map: Dict[str, Chunk] = {}
@@ -258,10 +338,21 @@ def validate_translated_placeholders(
         chunk_map[chunk.id] = chunk
 
     # 4. 逐 chunk 校验
+    by_id = isinstance(translated_chunks, dict)
+    if by_id:
+        items = translated_chunks.items()
+    else:
+        items = (
+            (chunk.id, text) for chunk, text in zip(doc.chunks, translated_chunks)
+        )
     fixed_chunks: Dict[str, str] = {}
+    fixed_list: List[Optional[str]] = []
     issues: List[Dict] = []
 
-    for chunk_id, translated_text in translated_chunks.items():
+    for chunk_id, translated_text in items:
+        if translated_text is None:
+            fixed_list.append(None)
+            continue
         trans_phs = set(ph_pattern.findall(translated_text))
         source_phs = source_ph_map.get(chunk_id, set())
 
@@ -337,6 +428,9 @@ def validate_translated_placeholders(
         if translated_text.strip() == "" and chunk_id in chunk_map:
             translated_text = chunk_map[chunk_id].content
 
-        fixed_chunks[chunk_id] = translated_text
+        if by_id:
+            fixed_chunks[chunk_id] = translated_text
+        else:
+            fixed_list.append(translated_text)
 
-    return fixed_chunks, issues
+    return (fixed_chunks if by_id else fixed_list), issues
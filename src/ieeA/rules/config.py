@@ -1,8 +1,9 @@
 import json
 import os
-import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
+from .yaml_cache import file_signature, load_yaml_cached
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
@@ -92,25 +93,29 @@ class Config(BaseModel):
     parser: ParserConfig = Field(default_factory=ParserConfig)
 
 
+def _default_config_path() -> Path:
+    return Path(__file__).parent.parent / "defaults" / "config.yaml"
+
+
+def _user_config_path() -> Path:
+    return Path.home() / ".ieeA" / "config.yaml"
+
+
 def load_defaults() -> Dict[str, Any]:
     """Load default configuration from the package."""
-    base_path = Path(__file__).parent.parent
-    default_path = base_path / "defaults" / "config.yaml"
+    default_path = _default_config_path()
 
     if default_path.exists():
-        with open(default_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_cached(default_path) or {}
     return {}
 
 
 def load_user_config() -> Dict[str, Any]:
     """Load user configuration from ~/.ieeA/config.yaml."""
-    home = Path.home()
-    config_path = home / ".ieeA" / "config.yaml"
+    config_path = _user_config_path()
 
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_cached(config_path) or {}
     return {}
 
 
@@ -126,7 +131,19 @@ def deep_merge(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def load_config() -> Config:
-    """Load and merge configuration from defaults and user overrides."""
+    """Load and merge configuration from defaults and user overrides.
+
+    Parsed results are cached per process, keyed by each file's path and
+    mtime, so edits are picked up while repeated calls skip re-parsing.
+    """
+    cached = _load_config_cached(
+        file_signature(_default_config_path()), file_signature(_user_config_path())
+    )
+    return cached.model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(default_key: Any, user_key: Any) -> Config:
     config_data = load_defaults()
     user_data = load_user_config()
     merged_data = deep_merge(config_data, user_data)
@@ -1,10 +1,14 @@
 """Few-shot example loading for translation."""
 
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 import logging
 
+from .yaml_cache import file_signature
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +45,17 @@ def load_examples(custom_path: Optional[str] = None) -> List[Dict[str, str]]:
         List of example dicts with 'source' and 'target' keys.
         Custom examples are appended after built-in examples.
     """
+    signature = file_signature(Path(custom_path)) if custom_path else None
+    return copy.deepcopy(list(_load_examples_cached(custom_path, signature)))
+
+
+# Cached per (path, mtime) so repeated loads (batch runs, tests) reuse parsed
+# YAML until the file changes; load_examples() hands out deep copies so callers
+# can't alter the cached examples.
+@lru_cache(maxsize=8)
+def _load_examples_cached(
+    custom_path: Optional[str], signature: Any
+) -> Tuple[Dict[str, str], ...]:
     examples = load_builtin_examples()
 
     if custom_path:
@@ -63,4 +78,4 @@ def load_examples(custom_path: Optional[str] = None) -> List[Dict[str, str]]:
             logger.warning(f"Failed to load custom examples from {custom_path}: {e}")
 
     logger.info(f"Total examples loaded: {len(examples)}")
-    return examples
+    return tuple(examples)
@@ -1,6 +1,7 @@
-import yaml
 from pathlib import Path
 from typing import Dict, Union, Optional, Any
+from functools import lru_cache
+from .yaml_cache import file_signature, load_yaml_cached
 from pydantic import BaseModel, Field
 
 
@@ -37,26 +38,42 @@ class Glossary(BaseModel):
         return self.terms.get(term)
 
 
+def _default_glossary_path() -> Path:
+    return Path(__file__).parent.parent / "defaults" / "glossary.yaml"
+
+
+def _user_glossary_path() -> Path:
+    return Path.home() / ".ieeA" / "glossary.yaml"
+
+
 def load_default_glossary() -> Dict[str, Any]:
-    base_path = Path(__file__).parent.parent
-    path = base_path / "defaults" / "glossary.yaml"
+    path = _default_glossary_path()
     if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_cached(path) or {}
     return {}
 
 
 def load_user_glossary() -> Dict[str, Any]:
-    home = Path.home()
-    path = home / ".ieeA" / "glossary.yaml"
+    path = _user_glossary_path()
     if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_cached(path) or {}
     return {}
 
 
 def load_glossary() -> Glossary:
-    """Load and merge glossary from defaults and user overrides."""
+    """Load and merge glossary from defaults and user overrides.
+
+    Cached per process by (path, mtime) of both files; callers get a copy.
+    """
+    cached = _load_glossary_cached(
+        file_signature(_default_glossary_path()),
+        file_signature(_user_glossary_path()),
+    )
+    return cached.model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_glossary_cached(default_key: Any, user_key: Any) -> Glossary:
     default_data = load_default_glossary()
     glossary = Glossary.from_dict(default_data)
 
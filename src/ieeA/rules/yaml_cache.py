@@ -0,0 +1,75 @@
+"""JSON sidecar cache for YAML rule files.
+
+Parsed YAML is written to ``~/.ieeA/.cache`` (or ``$IEEA_CACHE_DIR``) as JSON
+keyed by the source file's mtime and size, so warm CLI launches skip the YAML
+tokenizer.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+def file_signature(path: Path) -> Tuple[str, Optional[int]]:
+    """(path, mtime_ns) key for in-process caches; mtime is None if missing."""
+    try:
+        return str(path), os.stat(path).st_mtime_ns
+    except OSError:
+        return str(path), None
+
+
+# Overrides the sidecar location (the test suite points it at a temp dir)
+CACHE_DIR_ENV = "IEEA_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".ieeA" / ".cache"
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, reusing a JSON snapshot while the file is unchanged.
+
+    Returns ``None`` for an empty document, like ``yaml.safe_load``.
+    """
+    stat = os.stat(path)
+    # Hash the path so same-named files (defaults vs user config) don't clash.
+    path_key = hashlib.sha1(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:8]
+    prefix = f"{path.stem}.{path_key}."
+    cache_dir = get_cache_dir()
+    cache_file = cache_dir / f"{prefix}{stat.st_mtime_ns}-{stat.st_size}.json"
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    try:
+        dumped = json.dumps(data, ensure_ascii=False)
+        # Skip caching if JSON can't represent the data faithfully
+        # (e.g. dates or non-string keys).
+        if json.loads(dumped) != data:
+            return data
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{prefix}*.json"):
+            stale.unlink(missing_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_text(dumped, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Skipping YAML cache for {path}: {e}")
+
+    return data
@@ -44,6 +44,8 @@ def get_sdk_client(
         key: Optional API key.
         endpoint: Optional API endpoint URL.
         **kwargs: Additional keyword arguments to pass to the provider constructor.
+            ``http_client`` (an ``httpx.AsyncClient``) is shared with the
+            underlying SDK so connections are pooled across requests.
 
     Returns:
         An instance of LLMProvider.
@@ -75,6 +77,8 @@ def get_sdk_client(
             **kwargs,
         )
     elif sdk == "ark":
+        # The Ark SDK manages its own transport.
+        kwargs.pop("http_client", None)
         return ArkProvider(model=model, api_key=key, base_url=endpoint, **kwargs)
     elif sdk == "bailian":
         from .bailian_provider import BailianProvider
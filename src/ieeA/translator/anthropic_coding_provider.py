@@ -1,5 +1,5 @@
 # pyright: reportPossiblyUnboundVariable=false, reportOptionalMemberAccess=false, reportMissingImports=false
-from typing import Optional, Dict, List, Union
+from typing import Any, Optional, Dict, List, Union
 from dataclasses import dataclass
 
 from .llm_base import LLMProvider
@@ -35,6 +35,7 @@ class AnthropicCodingProvider(LLMProvider):
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         full_glossary=None,
+        http_client: Optional[Any] = None,
         **kwargs,
     ):
         super().__init__(model, api_key, **kwargs)
@@ -44,7 +45,9 @@ class AnthropicCodingProvider(LLMProvider):
                 "Please install it with `pip install anthropic`."
             )
 
-        self.client = anthropic.AsyncAnthropic(api_key=api_key, base_url=base_url)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, base_url=base_url, http_client=http_client
+        )
         self.message_history: List[Dict[str, str]] = []
 
         self._full_glossary_hints: Optional[Dict[str, str]] = None
@@ -1,5 +1,5 @@
 # pyright: reportPossiblyUnboundVariable=false, reportOptionalMemberAccess=false, reportArgumentType=false
-from typing import Optional, Dict, List, Union
+from typing import Any, Optional, Dict, List, Union
 from .llm_base import LLMProvider
 from .prompts import build_system_prompt
 
@@ -18,6 +18,7 @@ class AnthropicProvider(LLMProvider):
         model: str = "claude-3-5-sonnet-20240620",
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        http_client: Optional[Any] = None,
         **kwargs,
     ):
         super().__init__(model, api_key, **kwargs)
@@ -26,7 +27,9 @@ class AnthropicProvider(LLMProvider):
                 "anthropic package is required for AnthropicProvider. Please install it with `pip install anthropic`."
             )
 
-        self.client = anthropic.AsyncAnthropic(api_key=api_key, base_url=base_url)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, base_url=base_url, http_client=http_client
+        )
         self._prebuilt_system_prompt: Optional[str] = None
         self._prebuilt_batch_prompt: Optional[str] = None
 
@@ -12,13 +12,14 @@ class DirectHTTPProvider(LLMProvider):
         model: str,
         api_key: Optional[str] = None,
         endpoint: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs,
     ):
         super().__init__(model, api_key, **kwargs)
         if endpoint is None:
             raise ValueError("endpoint is required for DirectHTTPProvider")
         self.endpoint = endpoint
-        self.client = httpx.AsyncClient(
+        self.client = http_client or httpx.AsyncClient(
             timeout=httpx.Timeout(connect=60.0, read=300.0, write=60.0, pool=60.0)
         )
         self._prebuilt_system_prompt: Optional[str] = None
@@ -39,6 +39,7 @@ class OpenAICodingProvider(LLMProvider):
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         full_glossary=None,
+        http_client: Optional[Any] = None,
         **kwargs,
     ):
         super().__init__(model, api_key, **kwargs)
@@ -58,6 +59,7 @@ class OpenAICodingProvider(LLMProvider):
             api_key=api_key,
             base_url=base_url,
             timeout=timeout_config,
+            http_client=http_client,
         )
 
         # Stateful history: accumulated user/assistant pairs
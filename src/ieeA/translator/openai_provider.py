@@ -28,6 +28,7 @@ class OpenAIProvider(LLMProvider):
         model: str = "gpt-4o",
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        http_client: Optional[Any] = None,
         **kwargs,
     ):
         super().__init__(model, api_key, **kwargs)
@@ -48,6 +49,7 @@ class OpenAIProvider(LLMProvider):
             api_key=api_key,
             base_url=base_url,
             timeout=timeout_config,
+            http_client=http_client,
         )
         self._prebuilt_system_prompt: Optional[str] = None
         self._prebuilt_batch_prompt: Optional[str] = None
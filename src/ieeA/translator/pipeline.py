@@ -1,11 +1,12 @@
 """Translation pipeline with dynamic glossary hints."""
 
 import asyncio
+import inspect
 import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union, Callable, cast
+from typing import Optional, Dict, List, Any, Union, Callable, NamedTuple, Sequence, cast
 
 from pydantic import BaseModel, Field
 
@@ -23,6 +24,23 @@ class TranslatedChunk(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class ChunkInput(NamedTuple):
+    """A chunk to translate. Plain ``{"chunk_id", "content"}`` dicts are also accepted."""
+
+    chunk_id: str
+    content: str
+
+
+ChunkLike = Union[ChunkInput, Dict[str, str]]
+
+
+def _as_chunk_inputs(chunks: Sequence[ChunkLike]) -> List[ChunkInput]:
+    return [
+        c if isinstance(c, ChunkInput) else ChunkInput(c["chunk_id"], c["content"])
+        for c in chunks
+    ]
+
+
 class TranslationPipeline:
     """
     Translation pipeline that orchestrates chunk translation with dynamic
@@ -73,6 +91,8 @@ class TranslationPipeline:
         self.per_call_timeout = per_call_timeout
         self._started_at: Optional[str] = None
         self._last_provider_cache_meta: Optional[Dict[str, Any]] = None
+        self._active_state: Optional[Dict[str, Any]] = None
+        self._active_total_chunks = 0
 
     def _build_glossary_hints(self, text: str) -> Dict[str, str]:
         """Build glossary hints filtered by case-insensitive term matching."""
@@ -125,17 +145,10 @@ class TranslationPipeline:
 
     def _count_newline_breaks(self, text: str) -> tuple[int, int]:
         """Count newline breaks using greedy paragraph-first matching."""
-        sl_count = 0
-        pl_count = 0
-        i = 0
-        while i < len(text):
-            if text.startswith("\n\n", i):
-                pl_count += 1
-                i += 2
-                continue
-            if text[i] == "\n":
-                sl_count += 1
-            i += 1
+        # str.count is non-overlapping left to right, i.e. the same greedy
+        # pairing of "\n\n" as a character scan
+        pl_count = text.count("\n\n")
+        sl_count = text.count("\n") - 2 * pl_count
         return sl_count, pl_count
 
     def _encode_newlines_for_llm(self, text: str) -> tuple[str, Dict[str, int]]:
@@ -145,21 +158,12 @@ class TranslationPipeline:
         self._assert_no_token_collision(escaped)
 
         sl_count, pl_count = self._count_newline_breaks(escaped)
-        encoded = []
-        i = 0
-        while i < len(escaped):
-            if escaped.startswith("\n\n", i):
-                encoded.append(self.NEWLINE_PARA_TOKEN)
-                i += 2
-                continue
-            if escaped[i] == "\n":
-                encoded.append(self.NEWLINE_SOFT_TOKEN)
-                i += 1
-                continue
-            encoded.append(escaped[i])
-            i += 1
+        # Paragraph breaks first, with the same greedy pairing as the count
+        encoded = escaped.replace("\n\n", self.NEWLINE_PARA_TOKEN).replace(
+            "\n", self.NEWLINE_SOFT_TOKEN
+        )
 
-        return "".join(encoded), {
+        return encoded, {
             "source_sl_count": sl_count,
             "source_pl_count": pl_count,
         }
@@ -305,18 +309,19 @@ class TranslationPipeline:
 
     async def translate_batch(
         self,
-        chunks: List[Dict[str, str]],
+        chunks: Sequence[ChunkLike],
         context: Optional[str] = None,
     ) -> List[TranslatedChunk]:
+        chunks = _as_chunk_inputs(chunks)
         encoded_chunks = []
         chunk_glossary_hints = []
         batch_glossary_hints: Dict[str, str] = {}
         source_breaks = []
         for chunk_data in chunks:
-            source_text = chunk_data["content"]
+            source_text = chunk_data.content
             encoded_text, break_meta = self._encode_newlines_for_llm(source_text)
             encoded_chunks.append(
-                {"chunk_id": chunk_data["chunk_id"], "content": encoded_text}
+                {"chunk_id": chunk_data.chunk_id, "content": encoded_text}
             )
             source_breaks.append(break_meta)
             glossary_hints = self._build_glossary_hints(source_text)
@@ -367,11 +372,11 @@ class TranslationPipeline:
 
             results.append(
                 TranslatedChunk(
-                    source=chunks[idx]["content"],
+                    source=chunks[idx].content,
                     translation=final_translation,
-                    chunk_id=chunks[idx]["chunk_id"],
+                    chunk_id=chunks[idx].chunk_id,
                     metadata={
-                        "source_length": len(chunks[idx]["content"]),
+                        "source_length": len(chunks[idx].content),
                         "batched": True,
                         "batch_id": None,
                         "glossary_hints": chunk_glossary_hints[idx],
@@ -389,7 +394,7 @@ class TranslationPipeline:
             )
 
         result_map = {r.chunk_id: r for r in results}
-        ordered_results = [result_map[c["chunk_id"]] for c in chunks]
+        ordered_results = [result_map[c.chunk_id] for c in chunks]
 
         return ordered_results
 
@@ -432,9 +437,20 @@ class TranslationPipeline:
                 encoding="utf-8",
             )
 
+    def flush_state(self) -> None:
+        """Persist whatever translate_document has completed so far.
+
+        Called by the CLI when a paper fails or is interrupted so that a rerun
+        can resume from the state file instead of starting over.
+        """
+        if self._active_state is not None:
+            self._save_state(
+                self._active_state, total_chunks=self._active_total_chunks
+            )
+
     async def translate_document(
         self,
-        chunks: List[Dict[str, str]],
+        chunks: Sequence[ChunkLike],
         context: Optional[str] = None,
         max_concurrent: int = 50,
         progress_callback: Optional[Callable[[int, int], None]] = None,
@@ -444,7 +460,7 @@ class TranslationPipeline:
         Translate a document consisting of multiple chunks with concurrent requests.
 
         Args:
-            chunks: List of chunk dictionaries with 'chunk_id' and 'content' keys.
+            chunks: ChunkInput tuples (or dicts with 'chunk_id' and 'content' keys).
             context: Optional context for all chunks.
             max_concurrent: Maximum number of concurrent translation requests.
             progress_callback: Optional callback (completed, total) for progress updates.
@@ -453,9 +469,12 @@ class TranslationPipeline:
             List of TranslatedChunk objects in the same order as input.
         """
         self._started_at = datetime.now().isoformat()
+        chunks = _as_chunk_inputs(chunks)
 
         state = self._load_state()
         completed_ids = set(state["completed"])
+        self._active_state = state
+        self._active_total_chunks = len(chunks)
 
         results_map: Dict[str, TranslatedChunk] = {}
         for result_data in state["results"]:
@@ -467,15 +486,15 @@ class TranslationPipeline:
         translatable_chunks = []
 
         for c in chunks:
-            if c["chunk_id"] not in completed_ids:
-                if placeholder_pattern.fullmatch(c["content"].strip()):
+            if c.chunk_id not in completed_ids:
+                if placeholder_pattern.fullmatch(c.content.strip()):
                     placeholder_chunks.append(c)
                 else:
                     translatable_chunks.append(c)
 
         for chunk_data in placeholder_chunks:
-            chunk_id = chunk_data["chunk_id"]
-            content = chunk_data["content"]
+            chunk_id = chunk_data.chunk_id
+            content = chunk_data.content
 
             placeholder_result = TranslatedChunk(
                 source=content,
@@ -489,10 +508,10 @@ class TranslationPipeline:
 
         if not translatable_chunks:
             self._save_state(state, total_chunks=len(chunks))
-            return [results_map[chunk_data["chunk_id"]] for chunk_data in chunks]
+            return [results_map[chunk_data.chunk_id] for chunk_data in chunks]
 
         # --- Document-level glossary + pre-built system prompts ---
-        all_text = " ".join(c["content"] for c in translatable_chunks)
+        all_text = " ".join(c.content for c in translatable_chunks)
         doc_glossary = self._build_glossary_hints(all_text)
 
         # Merge abstract context (same logic as translate_chunk)
@@ -536,17 +555,17 @@ class TranslationPipeline:
         short_chunks = []
         long_chunks = []
         for c in translatable_chunks:
-            if len(c["content"]) < SHORT_THRESHOLD:
+            if len(c.content) < SHORT_THRESHOLD:
                 short_chunks.append(c)
             else:
                 long_chunks.append(c)
 
-        batches: List[List[Dict[str, str]]] = []
-        current_batch: List[Dict[str, str]] = []
+        batches: List[List[ChunkInput]] = []
+        current_batch: List[ChunkInput] = []
         current_len = 0
 
         for chunk in short_chunks:
-            chunk_len = len(chunk["content"])
+            chunk_len = len(chunk.content)
             if current_len + chunk_len > MAX_BATCH_CHARS and current_batch:
                 batches.append(current_batch)
                 current_batch = []
@@ -591,8 +610,8 @@ class TranslationPipeline:
                         batch_results = []
                         for chunk_data in batch:
                             result = await self.translate_chunk(
-                                chunk=chunk_data["content"],
-                                chunk_id=chunk_data["chunk_id"],
+                                chunk=chunk_data.content,
+                                chunk_id=chunk_data.chunk_id,
                                 context=context,
                             )
                             batch_results.append(result)
@@ -600,8 +619,8 @@ class TranslationPipeline:
                     batch_results = []
                     for chunk_data in batch:
                         result = await self.translate_chunk(
-                            chunk=chunk_data["content"],
-                            chunk_id=chunk_data["chunk_id"],
+                            chunk=chunk_data.content,
+                            chunk_id=chunk_data.chunk_id,
                             context=context,
                         )
                         batch_results.append(result)
@@ -622,8 +641,8 @@ class TranslationPipeline:
 
             for chunk_data in long_chunks:
                 result = await self.translate_chunk(
-                    chunk=chunk_data["content"],
-                    chunk_id=chunk_data["chunk_id"],
+                    chunk=chunk_data.content,
+                    chunk_id=chunk_data.chunk_id,
                     context=context,
                 )
                 results_map[result.chunk_id] = result
@@ -647,7 +666,7 @@ class TranslationPipeline:
             )
             self._save_state(state, total_chunks=len(chunks))
 
-            return [results_map[chunk_data["chunk_id"]] for chunk_data in chunks]
+            return [results_map[chunk_data.chunk_id] for chunk_data in chunks]
         # --- END SEQUENTIAL PATH ---
 
         # --- CONCURRENT EXECUTION PATH (existing, unchanged) ---
@@ -657,7 +676,7 @@ class TranslationPipeline:
         total_pending = len(translatable_chunks)
 
         async def translate_batch_with_semaphore(
-            batch_chunks: List[Dict[str, str]],
+            batch_chunks: List[ChunkInput],
             batch_index: int,
         ) -> List[TranslatedChunk]:
             nonlocal completed_count
@@ -687,11 +706,9 @@ class TranslationPipeline:
                     if isinstance(result, Exception):
                         chunk_data = batch_chunks[i]
                         skipped_chunk = TranslatedChunk(
-                            source=chunk_data["content"],
-                            translation=chunk_data[
-                                "content"
-                            ],  # Preserve original English
-                            chunk_id=chunk_data["chunk_id"],
+                            source=chunk_data.content,
+                            translation=chunk_data.content,  # Preserve original English
+                            chunk_id=chunk_data.chunk_id,
                             metadata={
                                 "skipped": True,
                                 "skip_reason": str(result),
@@ -719,13 +736,13 @@ class TranslationPipeline:
             return batch_results
 
         async def translate_with_semaphore(
-            chunk_data: Dict[str, str],
+            chunk_data: ChunkInput,
         ) -> TranslatedChunk:
             try:
                 async with semaphore:
                     result = await self.translate_chunk(
-                        chunk=chunk_data["content"],
-                        chunk_id=chunk_data["chunk_id"],
+                        chunk=chunk_data.content,
+                        chunk_id=chunk_data.chunk_id,
                         context=context,
                     )
 
@@ -742,9 +759,9 @@ class TranslationPipeline:
             except Exception as e:
                 # Return skipped chunk with original text on any error
                 skipped_chunk = TranslatedChunk(
-                    source=chunk_data["content"],
-                    translation=chunk_data["content"],
-                    chunk_id=chunk_data["chunk_id"],
+                    source=chunk_data.content,
+                    translation=chunk_data.content,
+                    chunk_id=chunk_data.chunk_id,
                     metadata={
                         "skipped": True,
                         "skip_reason": str(e),
@@ -760,82 +777,78 @@ class TranslationPipeline:
                             pass
                 return skipped_chunk
 
+        async def record_completed(task: Any) -> Any:
+            # Record results into state as soon as each top-level task finishes
+            # so partial progress can be persisted on cancellation or failure.
+            result = await task
+            completed = result if isinstance(result, list) else [result]
+            for translated_chunk in completed:
+                results_map[translated_chunk.chunk_id] = translated_chunk
+                state["completed"].append(translated_chunk.chunk_id)
+                state["results"].append(translated_chunk.model_dump())
+            return result
+
         batch_tasks = [
-            translate_batch_with_semaphore(batch, i) for i, batch in enumerate(batches)
+            record_completed(translate_batch_with_semaphore(batch, i))
+            for i, batch in enumerate(batches)
+        ]
+        long_tasks = [
+            record_completed(translate_with_semaphore(c)) for c in long_chunks
         ]
-        long_tasks = [translate_with_semaphore(c) for c in long_chunks]
 
         all_tasks = batch_tasks + long_tasks
 
         # Cache warmup: send the first request alone to establish prefix cache
         # on the server side, then concurrently send remaining requests.
-        if all_tasks:
-            try:
-                first_result = await all_tasks[0]
-            except Exception as e:
-                first_result = e
+        try:
+            if all_tasks:
+                try:
+                    first_result = await all_tasks[0]
+                except Exception as e:
+                    first_result = e
 
-            if len(all_tasks) > 1:
-                remaining_results = await asyncio.gather(
-                    *all_tasks[1:], return_exceptions=True
-                )
-                results = [first_result] + list(remaining_results)
+                if len(all_tasks) > 1:
+                    remaining_results = await asyncio.gather(
+                        *all_tasks[1:], return_exceptions=True
+                    )
+                    results = [first_result] + list(remaining_results)
+                else:
+                    results = [first_result]
             else:
-                results = [first_result]
-        else:
-            results = []
+                results = []
+        except BaseException:
+            # Cancelled or interrupted (Ctrl-C): keep the chunks finished so
+            # far so a rerun resumes instead of starting over.
+            for task in all_tasks:
+                if inspect.getcoroutinestate(task) == inspect.CORO_CREATED:
+                    task.close()
+            self._save_state(state, total_chunks=len(chunks))
+            raise
 
         skipped_count = 0
         for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Convert exception to graceful skip with original text
-                if i < len(batches):
-                    batch = batches[i]
-                    for chunk_data in batch:
-                        skipped_chunk = TranslatedChunk(
-                            source=chunk_data["content"],
-                            translation=chunk_data["content"],
-                            chunk_id=chunk_data["chunk_id"],
-                            metadata={
-                                "skipped": True,
-                                "skip_reason": str(result),
-                                "skipped_at": datetime.now().isoformat(),
-                            },
-                        )
-                        results_map[chunk_data["chunk_id"]] = skipped_chunk
-                        state["completed"].append(chunk_data["chunk_id"])
-                        state["results"].append(skipped_chunk.model_dump())
-                        skipped_count += 1
-                else:
-                    chunk_idx = i - len(batches)
-                    chunk_data = long_chunks[chunk_idx]
-                    skipped_chunk = TranslatedChunk(
-                        source=chunk_data["content"],
-                        translation=chunk_data["content"],
-                        chunk_id=chunk_data["chunk_id"],
-                        metadata={
-                            "skipped": True,
-                            "skip_reason": str(result),
-                            "skipped_at": datetime.now().isoformat(),
-                        },
-                    )
-                    results_map[chunk_data["chunk_id"]] = skipped_chunk
-                    state["completed"].append(chunk_data["chunk_id"])
-                    state["results"].append(skipped_chunk.model_dump())
-                    skipped_count += 1
+            if not isinstance(result, Exception):
                 continue
-
+            # Convert exception to graceful skip with original text
             if i < len(batches):
-                batch_results = cast(List[TranslatedChunk], result)
-                for translated_chunk in batch_results:
-                    results_map[translated_chunk.chunk_id] = translated_chunk
-                    state["completed"].append(translated_chunk.chunk_id)
-                    state["results"].append(translated_chunk.model_dump())
+                failed_chunks = batches[i]
             else:
-                success_result = cast(TranslatedChunk, result)
-                results_map[success_result.chunk_id] = success_result
-                state["completed"].append(success_result.chunk_id)
-                state["results"].append(success_result.model_dump())
+                failed_chunks = [long_chunks[i - len(batches)]]
+            for chunk_data in failed_chunks:
+                skipped_chunk = TranslatedChunk(
+                    source=chunk_data.content,
+                    translation=chunk_data.content,
+                    chunk_id=chunk_data.chunk_id,
+                    metadata={
+                        "skipped": True,
+                        "skip_reason": str(result),
+                        "skipped_at": datetime.now().isoformat(),
+                    },
+                )
+                results_map[chunk_data.chunk_id] = skipped_chunk
+                state["completed"].append(chunk_data.chunk_id)
+                state["results"].append(skipped_chunk.model_dump())
+                skipped_count += 1
 
         # Log warning if any chunks were skipped
         if skipped_count > 0:
@@ -851,4 +864,4 @@ class TranslationPipeline:
 
         self._save_state(state, total_chunks=len(chunks))
 
-        return [results_map[chunk_data["chunk_id"]] for chunk_data in chunks]
+        return [results_map[chunk_data.chunk_id] for chunk_data in chunks]
@@ -1,35 +1,30 @@
 import re
 from typing import List, Tuple, Set, Dict, Any, Optional
 
+# A brace/bracket, or an escaped brace or backslash
+_BRACKET_TOKEN_RE = re.compile(r"\\[{}\\]|[{}\[\]]")
+# An escape pair (\x) or a brace; pairs keep runs of backslashes aligned
+_ESCAPE_OR_BRACE_RE = re.compile(r"\\.|[{}]", re.DOTALL)
 
-class BuiltInRules:
-    @staticmethod
-    def _is_escaped_brace(text: str, index: int) -> bool:
-        backslash_count = 0
-        cursor = index - 1
-        while cursor >= 0 and text[cursor] == "\\":
-            backslash_count += 1
-            cursor -= 1
-        return backslash_count % 2 == 1
 
+class BuiltInRules:
     @staticmethod
     def _brace_text_tokens(text: str) -> List[Tuple[str, int]]:
         tokens: List[Tuple[str, int]] = []
-        in_text = False
         text_start = 0
 
-        for idx, char in enumerate(text):
-            if char in "{}" and not BuiltInRules._is_escaped_brace(text, idx):
-                if in_text:
-                    tokens.append(("T", text_start))
-                    in_text = False
-                tokens.append((char, idx))
-            else:
-                if not in_text:
-                    in_text = True
-                    text_start = idx
-
-        if in_text:
+        # Visit only unescaped braces; the text between them is one "T" token
+        for match in _ESCAPE_OR_BRACE_RE.finditer(text):
+            char = match.group()
+            if len(char) == 2:
+                continue
+            idx = match.start()
+            if idx > text_start:
+                tokens.append(("T", text_start))
+            tokens.append((char, idx))
+            text_start = idx + 1
+
+        if text_start < len(text):
             tokens.append(("T", text_start))
 
         return tokens
@@ -202,28 +197,12 @@ class BuiltInRules:
         errors = []
         mapping = {"]": "[", "}": "{"}
 
-        i = 0
-        while i < len(text):
-            char = text[i]
-
-            if char == "\\":
-                if i + 1 < len(text):
-                    next_char = text[i + 1]
-                    if next_char in "{}":
-                        i += 2
-                        continue
-                    elif next_char == "\\":
-                        i += 2
-                        continue
-                    else:
-                        i += 1
-                        while i < len(text) and text[i].isalpha():
-                            i += 1
-                        continue
-                else:
-                    i += 1
-                    continue
-
+        # Jump between brackets; \{, \} and \\ are matched whole and skipped
+        for match in _BRACKET_TOKEN_RE.finditer(text):
+            char = match.group()
+            if len(char) == 2:
+                continue
+            i = match.start()
             if char in "{[":
                 stack.append((char, i))
             elif char in "}]":
@@ -236,8 +215,6 @@ class BuiltInRules:
                             f"Mismatched brace '{char}' at {i}, expected closing for '{last_open}'"
                         )
 
-            i += 1
-
         if stack:
             for char, pos in stack:
                 errors.append(f"Unmatched opening brace '{char}' at position {pos}")
@@ -50,8 +50,13 @@ def test_extract_pre_protection_chunks_handles_author_and_caption():
     assert re.search(r"\{\{CHUNK_[a-f0-9-]+\}\}", processed)
 
     contexts = {chunk.context for chunk in parser.chunks}
-    assert "protected" in contexts
+    assert "protected" not in contexts
     assert "caption" in contexts
+    assert any(
+        value == "\\author{Alice and Bob}"
+        for key, value in parser.placeholder_map.items()
+        if key.startswith("[[AUTHOR_")
+    )
 
 
 def test_protect_environments_shields_inline_math_inside_algorithm():
@@ -114,6 +119,33 @@ After
     )
 
 
+def test_protect_environments_single_pass_outermost_wins():
+    parser = LaTeXParser()
+
+    text = (
+        "A\n\\begin{table}\n\\begin{equation}x\\end{equation}\n\\end{table}\n"
+        "B \\begin{equation}a \\begin{equation}b\\end{equation}\\end{equation} C\n"
+        "\\begin{align}y\\end{align}"
+    )
+    processed = parser._protect_environments(text)
+
+    assert processed == "A\n[[ENV_1]]\nB [[ENV_2]] C\n[[ENV_3]]"
+    assert parser.placeholder_map["[[ENV_1]]"].startswith("\\begin{table}")
+    assert parser.placeholder_map["[[ENV_2]]"] == (
+        "\\begin{equation}a \\begin{equation}b\\end{equation}\\end{equation}"
+    )
+    assert parser.placeholder_map["[[ENV_3]]"] == "\\begin{align}y\\end{align}"
+
+
+def test_protect_environments_keeps_unbalanced_environment():
+    parser = LaTeXParser()
+
+    text = "\\begin{equation} open \\begin{align}z\\end{align}"
+    processed = parser._protect_environments(text)
+
+    assert processed == "\\begin{equation} open [[ENV_1]]"
+
+
 def test_extract_translatable_text_creates_expected_chunks():
     parser = LaTeXParser()
 
@@ -128,3 +160,169 @@ This paragraph is intentionally long enough to be extracted as a translatable ch
     contexts = {chunk.context for chunk in parser.chunks}
     assert "section" in contexts
     assert "paragraph" in contexts
+
+
+def test_nested_translatable_environments_reconstruct_losslessly(tmp_path):
+    source = (
+        "\\documentclass{article}\n\\begin{document}\n"
+        "\\section{Intro \\subsection{Inner}}\n"
+        "\\begin{itemize}\n  \\item Outer item text.\n"
+        "  \\begin{enumerate}\n    \\item Nested enumerate item text.\n"
+        "  \\end{enumerate}\n\\end{itemize}\n"
+        "\\end{document}\n"
+    )
+    tex_file = tmp_path / "main.tex"
+    tex_file.write_text(source, encoding="utf-8")
+
+    doc = LaTeXParser().parse_file(str(tex_file))
+
+    assert [c.context for c in doc.chunks] == ["section", "itemize"]
+    assert "{{CHUNK_" not in doc.reconstruct()
+    assert "Nested enumerate item text." in doc.reconstruct()
+
+
+def test_brace_matching_helpers():
+    parser = LaTeXParser()
+
+    text = r"\author{A {B} \{ C}} tail"
+    # Both helpers skip escaped braces
+    assert parser._find_closing_brace(text, len(r"\author{")) == len(r"\author{A {B} \{ C}")
+    assert parser._find_closing_brace("{open", 1) is None
+    # An escaped backslash doesn't escape the brace after it
+    assert parser._find_closing_brace(r"a\\}b", 0) == len(r"a\\}")
+    assert parser._parse_balanced_group(text, len(r"\author"), "{", "}") == (
+        r"A {B} \{ C",
+        len(r"\author{A {B} \{ C}"),
+    )
+    assert parser._parse_balanced_group("[a [b] \\]]x", 0, "[", "]") == (
+        "a [b] \\]",
+        len("[a [b] \\]]"),
+    )
+
+
+def test_flatten_latex_nested_repeated_and_circular_includes(tmp_path):
+    (tmp_path / "sec").mkdir()
+    (tmp_path / "sec" / "a.tex").write_text("A[\\input{b}]", encoding="utf-8")
+    (tmp_path / "sec" / "b.tex").write_text("B", encoding="utf-8")
+    (tmp_path / "loop.tex").write_text("L\\input{loop}", encoding="utf-8")
+
+    parser = LaTeXParser()
+    content = "x\\input{sec/a}\n\\include{sec/a.tex}\n%\\input{sec/b}\n\\input{loop}"
+    flattened = parser._flatten_latex(content, str(tmp_path))
+
+    assert flattened == "xA[B]\nA[B]\n%\\input{sec/b}\nL\\input{loop}"
+    assert parser._flatten_latex("no directives", str(tmp_path)) == "no directives"
+
+
+def test_protect_display_math_single_pass():
+    parser = LaTeXParser()
+
+    text = r"a \(x\) b \[ y \[ z \] c \( open"
+    processed = parser._protect_display_math(text)
+
+    assert processed == r"a [[MATH_1]] b [[MATH_2]] c \( open"
+    assert parser.placeholder_map["[[MATH_1]]"] == r"\(x\)"
+    assert parser.placeholder_map["[[MATH_2]]"] == r"\[ y \[ z \]"
+
+
+def test_protect_commands_single_pass():
+    parser = LaTeXParser()
+
+    text = (
+        r"See \ref{fig:a} and \cite{x,y}, \href{\url{http://a.b}}{site}"
+        r" \includegraphics[width=1cm]{img.png} \eqref{eq} \citep{z} \label{open"
+    )
+    processed = parser._protect_commands(text)
+
+    assert processed == (
+        r"See [[REF_1]] and [[CITE_2]], [[HREF_3]]{site}"
+        r" [[GRAPHICS_4]] [[REF_5]] \citep{z} \label{open"
+    )
+    assert parser.placeholder_map["[[HREF_3]]"] == r"\href{\url{http://a.b}}"
+    assert parser.placeholder_map["[[GRAPHICS_4]]"] == (
+        r"\includegraphics[width=1cm]{img.png}"
+    )
+
+
+def test_protect_inline_math_delimiters():
+    parser = LaTeXParser()
+
+    text = "Cost \\$5, $a$ and $$b \\$ c$$; $x\n\ny$ stays; tail $open"
+    processed = parser._protect_inline_math(text)
+
+    assert processed == (
+        "Cost \\$5, [[MATH_1]] and [[MATH_2]]; $x\n\ny$ stays; tail [[MATH_3]]"
+    )
+    assert parser.placeholder_map["[[MATH_2]]"] == "$$b \\$ c$$"
+    assert parser.placeholder_map["[[MATH_3]]"] == "$open"
+
+
+def test_caption_no_scan_ranges_nested_and_unterminated():
+    parser = LaTeXParser()
+
+    text = (
+        "\\begin{figure}\\caption{a}\\end{figure}"
+        "\\begin{verbatim}\\begin{verbatim}x\\end{verbatim}\\caption{b}\\end{verbatim}"
+        "\\endinput \\begin {lstlisting}\\caption{c}"
+    )
+    first_end = text.index("\\endinput")
+
+    assert parser._build_caption_no_scan_ranges(text) == [
+        (text.index("\\begin{verbatim}"), first_end),
+        (text.index("\\begin {lstlisting}"), len(text)),
+    ]
+
+
+def test_remove_comments_fast_paths_and_verbatim():
+    parser = LaTeXParser()
+
+    content = "\n".join(
+        [
+            "Text   ",
+            "  % full line",
+            "%!TEX program = xelatex",
+            "keep 50\\% here % drop",
+            "\\begin{verbatim} % kept",
+            "% kept too",
+            "\\end{verbatim} % dropped",
+            "\\begin{comment}x\\end{comment} % dropped",
+        ]
+    )
+
+    assert parser._remove_comments(content) == "\n".join(
+        [
+            "Text",
+            "%!TEX program = xelatex",
+            "keep 50\\% here",
+            "\\begin{verbatim} % kept",
+            "% kept too",
+            "\\end{verbatim}",
+            "\\begin{comment}x\\end{comment}",
+        ]
+    )
+
+
+def test_flatten_latex_normalises_include_paths(tmp_path):
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d" / "a.tex").write_text("A\\input{../d/a}", encoding="utf-8")
+    (tmp_path / "d" / "b.tex").write_text("B", encoding="utf-8")
+
+    parser = LaTeXParser()
+    flattened = parser._flatten_latex(
+        "\\input{d/a}|\\input{d/../d/b}|\\input{./d/b.tex}", str(tmp_path)
+    )
+
+    # The self-include is caught even though it is spelled differently
+    assert flattened == "A\\input{../d/a}|B|B"
+
+
+def test_extract_abstract_drops_comment_lines():
+    parser = LaTeXParser()
+
+    content = (
+        "\\begin{abstract}\n  % leading note\nWe study 50\\% of X.\n"
+        "\t%inner\n\nMore text.\n%last\\end{abstract}"
+    )
+
+    assert parser.extract_abstract(content) == "We study 50\\% of X.\n\nMore text."
+    assert parser.extract_abstract("\\begin{abstract}%only\\end{abstract}") is None
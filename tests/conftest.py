@@ -4,6 +4,14 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock
 
 
+@pytest.fixture(autouse=True)
+def isolated_yaml_cache(tmp_path_factory, monkeypatch):
+    """Keep YAML sidecar cache files out of the real ~/.ieeA/.cache."""
+    from ieeA.rules.yaml_cache import CACHE_DIR_ENV
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path_factory.mktemp("yaml_cache")))
+
+
 @pytest.fixture
 def mock_openai_response():
     """Create a mock OpenAI chat completion response."""
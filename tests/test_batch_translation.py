@@ -3,7 +3,7 @@
 import pytest
 import re
 from unittest.mock import AsyncMock, MagicMock, patch
-from ieeA.translator.pipeline import TranslationPipeline, TranslatedChunk
+from ieeA.translator.pipeline import ChunkInput, TranslationPipeline, TranslatedChunk
 from ieeA.translator.prompts import build_batch_translation_text
 
 
@@ -199,6 +199,27 @@ class TestBatchTranslationIntegration:
         assert "翻译:" in results[1].translation
 
 
+    @pytest.mark.asyncio
+    async def test_chunk_input_tuples_accepted(self):
+        """ChunkInput 元组与字典输入等价"""
+        mock_provider = AsyncMock()
+        mock_provider.translate = AsyncMock(return_value="[1] 甲\n[2] 乙")
+
+        pipeline = TranslationPipeline(provider=mock_provider)
+
+        chunks = [
+            ChunkInput("1", "Short 1"),
+            {"chunk_id": "2", "content": "Short 2"},
+            ChunkInput("3", "[[MATH_1]]"),
+        ]
+
+        results = await pipeline.translate_document(chunks, max_concurrent=1)
+
+        assert [r.chunk_id for r in results] == ["1", "2", "3"]
+        assert [r.translation for r in results] == ["甲", "乙", "[[MATH_1]]"]
+        assert results[0].source == "Short 1"
+
+
 class TestNewlineHallucinationHandling:
     """Tests for raw newline stripping and newline token mismatch warnings."""
 
@@ -271,3 +292,13 @@ class TestNewlineHallucinationHandling:
         assert results[1].metadata["newline_token_mismatch"] is True
         assert results[1].metadata["llm_pl_token_count"] == 2
         assert results[1].metadata["source_pl_count"] == 1
+
+    def test_encode_newlines_pairs_paragraph_breaks_greedily(self):
+        """三个连续换行编码为一个 [[PL]] 加一个 [[SL]]，计数与编码一致。"""
+        pipeline = TranslationPipeline(provider=MagicMock())
+
+        encoded, meta = pipeline._encode_newlines_for_llm("A\r\n\n\nB\nC")
+
+        assert encoded == "A[[PL]][[SL]]B[[SL]]C"
+        assert meta == {"source_sl_count": 2, "source_pl_count": 1}
+        assert pipeline._count_newline_breaks("\n\n\n\n\n") == (1, 2)
@@ -210,3 +210,10 @@ Some text
         assert r"\section{Next}" in result
         assert r"\input{refs.bbl}" in result
         assert r"\bibliographystyle{plain}" not in result
+
+    def test_text_without_bibliography_returned_unchanged(self):
+        """Text with no \bibliography{} is returned as-is, without a scan."""
+        text = r"\section{Intro} Plain text with \input-like words."
+
+        assert self.parser._resolve_bibliography(text, self.temp_dir) is text
+        assert self.parser._flatten_latex(text, self.temp_dir) == text
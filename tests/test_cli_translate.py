@@ -0,0 +1,27 @@
+"""Tests for `ieeA translate` argument handling."""
+
+from typer.testing import CliRunner
+
+from ieeA.cli import app
+
+runner = CliRunner()
+
+
+def test_abstract_rejected_for_multiple_papers():
+    result = runner.invoke(
+        app, ["translate", "2401.00001", "2401.00002", "--abstract", "Some abstract"]
+    )
+    assert result.exit_code == 1
+    assert "--abstract applies to a single paper" in result.output
+
+
+def test_placeholder_issue_lines_show_full_chunk_id():
+    from ieeA.cli import _PH_FMT
+
+    prefix = "0123456789abcdef0123456789abcdef"
+    lines = {
+        _PH_FMT["missing"].format(cid=f"{prefix}-{n}", bad="[[MATH_1]]")
+        for n in (3, 14)
+    }
+    assert len(lines) == 2
+    assert all(f"{prefix}-" in line for line in lines)
@@ -0,0 +1,135 @@
+"""Tests for the shared HTTP connection pool used by `ieeA translate`."""
+
+import asyncio
+import json
+
+import pytest
+
+from ieeA.cli import _build_http_client
+from ieeA.translator.http_provider import DirectHTTPProvider
+
+
+class SlowChatServer:
+    """Local OpenAI-compatible endpoint that answers after a fixed delay.
+
+    Tracks how many requests are being served at the same time.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def endpoint(self) -> str:
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1/chat/completions"
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    name, _, value = line.partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                request = json.loads(await reader.readexactly(length))
+
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(self.delay)
+                self.active -= 1
+
+                text = request["messages"][-1]["content"]
+                body = json.dumps(
+                    {"choices": [{"message": {"content": f"译:{text}"}}]}
+                ).encode("utf-8")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def test_pool_wait_has_no_shorter_deadline_than_read():
+    client = _build_http_client(8)
+    try:
+        assert client.timeout.pool is None
+        assert client.timeout.read == 300.0
+    finally:
+        asyncio.run(client.aclose())
+
+
+@pytest.mark.asyncio
+async def test_every_request_in_flight_gets_a_connection():
+    concurrency = 4
+    client = _build_http_client(concurrency)
+    try:
+        async with SlowChatServer(delay=0.3) as server:
+            provider = DirectHTTPProvider(
+                model="fake", endpoint=server.endpoint, http_client=client
+            )
+            results = await asyncio.gather(
+                *(provider.translate(f"text {i}") for i in range(concurrency))
+            )
+    finally:
+        await client.aclose()
+
+    assert results == [f"译:text {i}" for i in range(concurrency)]
+    # All requests were served at once instead of queueing for a connection
+    assert server.peak == concurrency
+
+
+@pytest.mark.asyncio
+async def test_two_papers_share_the_pool_without_dropping_chunks(tmp_path):
+    from ieeA.translator.pipeline import TranslationPipeline
+
+    papers, concurrency = 2, 3
+    client = _build_http_client(papers * concurrency)
+
+    async def translate_paper(name: str, endpoint: str):
+        pipeline = TranslationPipeline(
+            provider=DirectHTTPProvider(
+                model="fake", endpoint=endpoint, http_client=client
+            ),
+            state_file=tmp_path / f"{name}.json",
+            batch_short_threshold=0,
+            max_retries=1,
+        )
+        # The first request goes out alone to warm the prompt cache; the
+        # remaining `concurrency` then run at once.
+        chunks = [
+            {"chunk_id": f"{name}-{i}", "content": f"{name} paragraph {i}"}
+            for i in range(concurrency + 1)
+        ]
+        return await pipeline.translate_document(chunks, max_concurrent=concurrency)
+
+    try:
+        async with SlowChatServer(delay=0.3) as server:
+            results = await asyncio.gather(
+                *(translate_paper(f"p{n}", server.endpoint) for n in range(papers))
+            )
+    finally:
+        await client.aclose()
+
+    for n, paper in enumerate(results):
+        assert [r.translation for r in paper] == [
+            f"译:p{n} paragraph {i}" for i in range(concurrency + 1)
+        ]
+        assert not any(r.metadata.get("skipped") for r in paper)
+    assert server.peak == papers * concurrency
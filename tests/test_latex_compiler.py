@@ -0,0 +1,163 @@
+"""Tests for LaTeXCompiler, driven by a fake TeX engine."""
+
+import asyncio
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ieeA.compiler import LaTeXCompiler
+
+# Writes main.log (naming the build directory) and main.pdf into the current
+# directory like xelatex. A source containing FAIL exits 1 without a PDF;
+# SLEEP=<s> delays the pass.
+FAKE_ENGINE = f"""#!{sys.executable}
+import os, pathlib, re, sys, time
+
+src = pathlib.Path(sys.argv[-1]).read_text()
+delay = re.search(r"SLEEP=([0-9.]+)", src)
+if delay:
+    time.sleep(float(delay.group(1)))
+with open("passes.txt", "a") as f:
+    f.write("pass\\n")
+if "FAIL" in src:
+    pathlib.Path("main.log").write_text("log start\\n! Undefined control sequence.\\nl.3\\n")
+    sys.exit(1)
+pathlib.Path("main.log").write_text("built in " + os.getcwd())
+pathlib.Path("main.pdf").write_bytes(b"%PDF-1.4\\n" + pathlib.Path("passes.txt").read_bytes())
+"""
+
+
+@pytest.fixture
+def compiler(tmp_path: Path) -> LaTeXCompiler:
+    engine = tmp_path / "fake-xelatex"
+    engine.write_text(FAKE_ENGINE)
+    engine.chmod(engine.stat().st_mode | stat.S_IXUSR)
+    compiler = LaTeXCompiler(timeout=10, build_root=None)
+    compiler.engines = [str(engine)]
+    return compiler
+
+
+@pytest.mark.asyncio
+async def test_compile_async_runs_all_passes_and_copies_pdf(compiler, tmp_path):
+    resources = tmp_path / "src"
+    (resources / "figs").mkdir(parents=True)
+    (resources / "figs" / "a.png").write_bytes(b"png")
+    output = tmp_path / "out" / "paper.pdf"
+
+    result = await compiler.compile_async(
+        "\\documentclass{article}", output, working_dir=resources
+    )
+
+    assert result.success, result.error_message
+    assert result.pdf_path == output.resolve()
+    # Four engine passes, as in the (engine + bibtex) x 2 cycle
+    assert output.read_bytes() == b"%PDF-1.4\n" + b"pass\n" * 4
+
+
+@pytest.mark.asyncio
+async def test_compile_async_keeps_event_loop_free(compiler, tmp_path):
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    started = time.monotonic()
+    try:
+        result = await compiler.compile_async("SLEEP=0.1", tmp_path / "out.pdf")
+    finally:
+        ticking.cancel()
+    elapsed = time.monotonic() - started
+
+    assert result.success
+    # The loop kept running while the engine slept in a subprocess
+    assert ticks >= elapsed / 0.01 / 2
+
+
+@pytest.mark.asyncio
+async def test_failed_compile_reports_error_from_log(compiler, tmp_path):
+    output = tmp_path / "out.pdf"
+
+    result = await compiler.compile_async("FAIL", output)
+
+    assert not result.success
+    assert "! Undefined control sequence." in result.error_message
+    assert not output.exists()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_pass_is_reported(compiler, tmp_path):
+    compiler.timeout = 0.2
+
+    result = await compiler.compile_async("SLEEP=5 FAIL", tmp_path / "out.pdf")
+
+    assert not result.success
+    assert "Compilation timed out" in result.error_message
+
+
+def test_compile_is_a_blocking_wrapper(compiler, tmp_path):
+    output = tmp_path / "out.pdf"
+
+    result = compiler.compile("\\documentclass{article}", output)
+
+    assert result.success
+    assert output.exists()
+
+
+@pytest.mark.asyncio
+async def test_builds_under_build_root_and_removes_it(compiler, tmp_path):
+    ram = tmp_path / "ram"
+    ram.mkdir()
+    compiler.build_root = ram
+
+    result = await compiler.compile_async("ok", tmp_path / "out.pdf")
+
+    assert result.success
+    assert result.log_content.startswith(f"built in {ram}{os.sep}ieeA-tex-")
+    assert list(ram.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_temp_dir_when_build_root_is_too_small(
+    compiler, tmp_path, monkeypatch
+):
+    ram = tmp_path / "ram"
+    ram.mkdir()
+    compiler.build_root = ram
+    resources = tmp_path / "src"
+    resources.mkdir()
+    (resources / "figure.pdf").write_bytes(b"x" * 1024)
+
+    import ieeA.compiler.latex_compiler as latex_compiler
+
+    real_disk_usage = latex_compiler.shutil.disk_usage
+
+    def tiny_tmpfs(path):
+        usage = real_disk_usage(path)
+        if Path(path) == ram:
+            return usage._replace(free=latex_compiler._BUILD_ROOT_HEADROOM + 1024)
+        return usage
+
+    monkeypatch.setattr(latex_compiler.shutil, "disk_usage", tiny_tmpfs)
+
+    result = await compiler.compile_async(
+        "ok", tmp_path / "out.pdf", working_dir=resources
+    )
+
+    assert result.success
+    assert not result.log_content.startswith(f"built in {ram}")
+    # Without resources to copy, the same root is roomy enough
+    assert compiler._pick_build_root(None) == ram
+
+
+def test_missing_build_root_uses_temp_dir(tmp_path):
+    compiler = LaTeXCompiler(build_root=tmp_path / "absent")
+
+    assert compiler._pick_build_root(None) is None
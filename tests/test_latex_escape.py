@@ -11,7 +11,7 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ieeA.parser.structure import escape_latex_special_chars, Chunk
+from ieeA.parser.structure import escape_latex_special_chars, Chunk, LaTeXDocument
 
 
 class TestBasicEscaping:
@@ -253,6 +253,27 @@ class TestReconstructEscapingIntegration:
         result = chunk.reconstruct(translated)
         assert result == r"\section{50\% progress \& results}"
 
+    def test_document_restores_leftover_preserved_elements(self):
+        """Chunk-level placeholders left in the document are restored; the
+        first chunk defining a placeholder wins."""
+        doc = LaTeXDocument(
+            preamble="",
+            body_template="{{CHUNK_test-7}} [[MATH_1]] [[MATH_2]]",
+            chunks=[
+                Chunk(
+                    id="test-7",
+                    content="Text",
+                    preserved_elements={"[[MATH_1]]": "$a$"},
+                ),
+                Chunk(
+                    id="test-8",
+                    content="Other",
+                    preserved_elements={"[[MATH_1]]": "$b$", "[[MATH_2]]": "$c$"},
+                ),
+            ],
+        )
+        assert doc.reconstruct() == "Text $a$ $c$"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -252,3 +252,27 @@ Some text between algorithms.
 
         finally:
             Path(temp_path).unlink()
+
+    def test_reconstruct_resolves_nested_placeholders_in_chunk_order(self):
+        """Nested global placeholders resolve fully; a chunk's output is only
+        searched for chunks listed after it, as with in-order replacement."""
+        doc = LaTeXDocument(
+            preamble="",
+            body_template="[[ENV_1]] {{CHUNK_outer}} [[UNKNOWN_9]]",
+            global_placeholders={
+                "[[ENV_1]]": r"\begin{algorithm}[[MATH_2]]\end{algorithm}",
+                "[[MATH_2]]": "$x$ {{CHUNK_cap}}",
+            },
+            chunks=[
+                Chunk(id="cap", content="Caption"),
+                Chunk(id="outer", content="see {{CHUNK_inner}} and {{CHUNK_cap}}"),
+                Chunk(id="inner", content="Inner"),
+            ],
+        )
+
+        result = doc.reconstruct({"cap": "图注", "inner": "内部"})
+
+        assert result == (
+            r"\begin{algorithm}$x$ 图注\end{algorithm} "
+            "see 内部 and {{CHUNK_cap}} [[UNKNOWN_9]]"
+        )
@@ -4,7 +4,7 @@ import re
 import pytest
 import tempfile
 from pathlib import Path
-from ieeA.parser.latex_parser import LaTeXParser
+from ieeA.parser.latex_parser import LaTeXParser, is_placeholder_only
 
 
 class TestParserChunkConsistency:
@@ -204,3 +204,71 @@ Body text on next line.
             assert title_found, f"Title 'textbf{Title}' should be in paragraph chunks"
         finally:
             Path(temp_path).unlink()
+
+    def test_structural_line_detection(self):
+        """结构行判定：行首命令/表格行/单独的换行命令"""
+        parser = LaTeXParser()
+        for line in [
+            r"\begin{figure}",
+            r"\section{Intro}",
+            r"\item First",
+            r"& 1 & 2",
+            r"[2pt]",
+            "%",
+            "\\\\",
+        ]:
+            assert parser._is_structural_line(line), line
+        for line in [
+            "Plain sentence.",
+            r"Text ending with a break \\",
+            "[[MATH_1]] follows",
+            r"\textbf{Bold} start",
+        ]:
+            assert not parser._is_structural_line(line), line
+
+    def test_chunk_ids_unique_and_placeholder_compatible(self):
+        """分块 id 唯一，且符合 {{CHUNK_[a-f0-9-]+}} 占位符格式"""
+        parser = LaTeXParser()
+        other = LaTeXParser()
+        ids = [parser._next_chunk_id() for _ in range(3)] + [other._next_chunk_id()]
+        assert len(set(ids)) == 4
+        for chunk_id in ids:
+            assert re.fullmatch(r"\{\{CHUNK_[a-f0-9-]+\}\}", f"{{{{CHUNK_{chunk_id}}}}}")
+
+
+def test_placeholder_patterns_are_ascii_only():
+    assert is_placeholder_only("  [[MATH_12]]\n")
+    # Non-ASCII digits are never produced by the parser
+    assert not is_placeholder_only("[[MATH_١٢]]")
+
+
+def test_is_placeholder_only_matches_placeholder_shape():
+    assert is_placeholder_only("[[MATH_ENV_3]]")
+    assert is_placeholder_only("[[__1]]")
+    for text in ["[[_1]]", "[[MATH_]]", "[[MATH1_2]]", "[[Math_1]]", "[[ÄB_1]]",
+                 "[[MATH_1]] tail", "[[A]]_1]]", "ordinary paragraph text"]:
+        assert not is_placeholder_only(text), text
+
+
+def test_paragraph_cleanup_matches_sequential_reference():
+    """整批清洗与“先删占位符、再删命令”的逐段清洗判定一致"""
+    placeholder_re = re.compile(r"\[\[[A-Z_]+_\d+\]\]|\{\{CHUNK_[a-f0-9-]+\}\}")
+    command_re = re.compile(r"\\[a-zA-Z]+\*?(?:\[[^\]]*\])?(?:\{[^}]*\})*|[{}\[\]\\]")
+
+    def reference_is_prose(para: str) -> bool:
+        clean = command_re.sub("", placeholder_re.sub("", para))
+        return len(clean.strip()) >= 20
+
+    paragraphs = [
+        r"\textbf[[MATH_1]]{twenty five characters of text}",
+        r"\cmd{a}[[MATH_2]]{twenty five characters of text}",
+        r"\cmd[opt [[MATH_3]] more optional text here]{x} ok",
+        r"\foo[[MATH_4]]barbazquxquuxcorgegraultgarply",
+        r"Plain prose with [[MATH_5]] inside that is long enough.",
+        r"\emph{{{CHUNK_ab-1}}twenty five characters of text}",
+    ]
+    parser = LaTeXParser()
+    result = parser._chunk_paragraph_batch(paragraphs)
+
+    for para, replaced in zip(paragraphs, result):
+        assert (replaced != para) == reference_is_prose(para), para
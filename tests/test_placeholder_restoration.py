@@ -59,8 +59,7 @@ class TestPlaceholderRestoration:
             finally:
                 Path(temp_path).unlink()
 
-        # Test case using _protect_author_block (stored in chunk.preserved_elements)
-        # This is a special case - author block is protected as a chunk
+        # Test case using _protect_author_block (stored in global_placeholders)
         author_doc = r"""\documentclass{article}
 \begin{document}
 \author{John Doe}
@@ -74,17 +73,14 @@ class TestPlaceholderRestoration:
             parser = LaTeXParser()
             doc = parser.parse_file(temp_path)
 
-            # Author block is stored in chunk's preserved_elements, not global_placeholders
-            author_found = False
-            for chunk in doc.chunks:
-                if "AUTHOR" in str(chunk.preserved_elements):
-                    author_found = True
-                    break
-
-            assert author_found, (
-                "AUTHOR placeholder should be in chunk.preserved_elements"
+            # Author block is a protected element, not a placeholder-only chunk
+            author_found = any(
+                key.startswith("[[AUTHOR_") for key in doc.global_placeholders
             )
 
+            assert author_found, "AUTHOR placeholder should be in global_placeholders"
+            assert not doc.chunks
+
             # Reconstruct without translation
             reconstructed = doc.reconstruct()
 
@@ -307,6 +303,36 @@ This paper reviews \cite{smith2020} and discusses $E=mc^2$.
         finally:
             Path(temp_path).unlink()
 
+    def test_translated_chunks_in_order_list(self):
+        """In-order translation list reconstructs the same as a chunk_id dict."""
+        original_doc = r"""
+\documentclass{article}
+\begin{document}
+\section{Introduction}
+This paper reviews \cite{smith2020} and discusses $E=mc^2$.
+\end{document}"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".tex", delete=False) as f:
+            f.write(original_doc)
+            temp_path = f.name
+
+        try:
+            parser = LaTeXParser()
+            doc = parser.parse_file(temp_path)
+
+            translations = [
+                chunk.content.replace("This paper reviews", "本文综述")
+                for chunk in doc.chunks
+            ]
+            by_id = {c.id: t for c, t in zip(doc.chunks, translations)}
+
+            assert doc.reconstruct(translations) == doc.reconstruct(by_id)
+            assert "本文综述" in doc.reconstruct(translations)
+            # Missing trailing entries fall back to the original content
+            assert doc.reconstruct([]) == doc.reconstruct()
+        finally:
+            Path(temp_path).unlink()
+
     def test_empty_document(self):
         """Test edge cases with empty documents."""
         # Empty document
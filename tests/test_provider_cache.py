@@ -727,3 +727,30 @@ class TestArkProviderCache:
         assert provider._context_ids["batch"] == "ctx-batch-new"
         assert provider._context_ids["individual"] == "ctx-ind"
         assert provider._context_id == "ctx-ind"
+
+
+class TestSharedHttpClient:
+    """Test that an injected httpx client is reused by providers."""
+
+    async def test_direct_http_provider_uses_shared_client(self):
+        import httpx
+        from ieeA.translator import get_sdk_client
+
+        async with httpx.AsyncClient() as shared_client:
+            provider = get_sdk_client(
+                None,
+                model="test-model",
+                endpoint="https://example.com/v1/chat/completions",
+                http_client=shared_client,
+            )
+            assert provider.client is shared_client
+
+    async def test_openai_provider_forwards_shared_client(self):
+        with patch("ieeA.translator.openai_provider.openai") as mock_openai:
+            from ieeA.translator.openai_provider import OpenAIProvider
+
+            shared_client = MagicMock()
+            OpenAIProvider(model="gpt-4", api_key="test", http_client=shared_client)
+
+            _, kwargs = mock_openai.AsyncOpenAI.call_args
+            assert kwargs["http_client"] is shared_client
@@ -0,0 +1,108 @@
+"""Tests for TeXCompiler, driven by a fake TeX engine."""
+
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from ieeA.compiler.engine import TeXCompiler
+
+# Mimics xelatex closely enough for the compiler: honours
+# -output-directory, writes .log/.aux and a PDF. A source containing FAIL
+# exits 1.
+FAKE_ENGINE = f"""#!{sys.executable}
+import pathlib, sys
+
+out, name = ".", None
+for arg in sys.argv[1:]:
+    if arg.startswith("-output-directory="):
+        out = arg.split("=", 1)[1]
+    elif not arg.startswith("-"):
+        name = arg
+src = pathlib.Path(name).read_text()
+stem, out = pathlib.Path(name).stem, pathlib.Path(out)
+(out / (stem + ".log")).write_text("fake log\\n! Fatal error here.\\n")
+(out / (stem + ".aux")).write_text("")
+if "FAIL" in src:
+    sys.exit(1)
+(out / (stem + ".pdf")).write_bytes(b"%PDF-1.4\\n")
+"""
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> str:
+    path = tmp_path / "fake-xelatex"
+    path.write_text(FAKE_ENGINE)
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    tex = src_dir / "main.tex"
+    tex.write_text("\\documentclass{article}\\begin{document}Hi\\end{document}")
+    return tex
+
+
+def test_default_build_writes_next_to_source(engine, source):
+    pdf = TeXCompiler(engine=engine).compile(source)
+
+    assert pdf == source.parent / "main.pdf"
+    assert pdf.exists()
+    # clean_aux removes intermediates from the source directory
+    assert not (source.parent / "main.aux").exists()
+    assert not (source.parent / "main.log").exists()
+
+
+def test_prepare_builds_command(engine, source, tmp_path):
+    compiler = TeXCompiler(engine=engine)
+
+    cmd, work_dir, target_dir = compiler._prepare(source, None)
+    assert cmd == [engine, "-interaction=nonstopmode", "main.tex"]
+    assert work_dir == target_dir == source.parent
+
+    out_dir = tmp_path / "out"
+    cmd, _, target_dir = compiler._prepare(source, out_dir)
+    assert cmd[-1] == f"-output-directory={out_dir.absolute()}"
+    assert target_dir == out_dir
+    assert out_dir.is_dir()
+
+    with pytest.raises(FileNotFoundError):
+        compiler._prepare(source.parent / "missing.tex", None)
+
+
+def test_output_dir_build_keeps_only_pdf(engine, source, tmp_path):
+    out_dir = tmp_path / "out"
+
+    pdf = TeXCompiler(engine=engine).compile(source, out_dir)
+
+    assert pdf == out_dir / "main.pdf"
+    assert sorted(p.name for p in out_dir.iterdir()) == ["main.pdf"]
+
+
+def test_failed_compile_reports_log_tail(engine, source, tmp_path):
+    source.write_text("FAIL")
+    out_dir = tmp_path / "out"
+
+    with pytest.raises(RuntimeError) as excinfo:
+        TeXCompiler(engine=engine).compile(source, out_dir)
+
+    message = str(excinfo.value)
+    assert f"Check log: {out_dir / 'main.log'}" in message
+    assert "! Fatal error here." in message
+
+
+def test_cleanup_removes_only_this_documents_aux_files(tmp_path):
+    names = ["main.aux", "main.log", "main.toc", "main.pdf", "main.tex",
+             "main.aux.bak", "other.aux", "mainx.log"]
+    for name in names:
+        (tmp_path / name).write_text("")
+
+    TeXCompiler()._cleanup(tmp_path, "main")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "main.aux.bak", "main.pdf", "main.tex", "mainx.log", "other.aux"
+    ]
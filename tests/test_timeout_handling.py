@@ -343,3 +343,107 @@ class TestStateFileSkippedRecording:
 
         metadata_json = json.dumps(results[0].metadata)
         assert "skipped" in metadata_json
+
+
+class TestPartialStateFlush:
+    """Test that concurrent translation progress can be flushed on failure."""
+
+    @pytest.mark.asyncio
+    async def test_flush_state_keeps_completed_chunks(self, tmp_path):
+        """中途失败时，flush_state 应保存已完成的 chunk 以便续跑。"""
+        hang = asyncio.Event()
+
+        class StubProvider:
+            async def translate(self, text, *args, **kwargs):
+                if text.startswith("second"):
+                    await hang.wait()
+                return "译文"
+
+        mock_provider = StubProvider()
+
+        state_file = tmp_path / "translation_state.json"
+        pipeline = TranslationPipeline(
+            provider=mock_provider,
+            max_retries=1,
+            state_file=state_file,
+            batch_short_threshold=10,
+        )
+
+        chunks = [
+            {"chunk_id": "chunk_1", "content": "first " + "a" * 50},
+            {"chunk_id": "chunk_2", "content": "second " + "b" * 50},
+        ]
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                pipeline.translate_document(chunks, max_concurrent=2), timeout=0.5
+            )
+
+        pipeline.flush_state()
+
+        import json
+
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        assert state["completed"] == ["chunk_1"]
+        assert state["results"][0]["translation"] == "译文"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_translation_saves_completed_chunks(self, tmp_path):
+        """翻译中途被取消（如 Ctrl-C）时，已完成的 chunk 应自动写入状态文件。"""
+        started = asyncio.Event()
+        hang = asyncio.Event()
+
+        class StubProvider:
+            async def translate(self, text, *args, **kwargs):
+                if not text.startswith("first"):
+                    started.set()
+                    await hang.wait()
+                return "译文"
+
+        state_file = tmp_path / "translation_state.json"
+        pipeline = TranslationPipeline(
+            provider=StubProvider(),
+            max_retries=1,
+            state_file=state_file,
+            batch_short_threshold=10,
+        )
+
+        chunks = [
+            {"chunk_id": "chunk_1", "content": "first " + "a" * 50},
+            {"chunk_id": "chunk_2", "content": "second " + "b" * 50},
+            {"chunk_id": "chunk_3", "content": "third " + "c" * 50},
+        ]
+
+        task = asyncio.create_task(
+            pipeline.translate_document(chunks, max_concurrent=2)
+        )
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        import json
+
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        assert state["completed"] == ["chunk_1"]
+        assert state["results"][0]["translation"] == "译文"
+
+        # A rerun resumes: only the unfinished chunks hit the provider
+        hang.set()
+        seen = []
+
+        class RecordingProvider:
+            async def translate(self, text, *args, **kwargs):
+                seen.append(text.split()[0])
+                return "译文"
+
+        pipeline = TranslationPipeline(
+            provider=RecordingProvider(),
+            max_retries=1,
+            state_file=state_file,
+            batch_short_threshold=10,
+        )
+        results = await pipeline.translate_document(chunks, max_concurrent=2)
+
+        assert sorted(seen) == ["second", "third"]
+        assert [r.chunk_id for r in results] == ["chunk_1", "chunk_2", "chunk_3"]
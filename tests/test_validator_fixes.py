@@ -30,6 +30,11 @@ class TestCheckBraces:
         result = BuiltInRules.check_braces(r"Math \left\{ x \right\}")
         assert result == []
 
+    def test_line_break_before_brace(self):
+        r"""\\ 之后的 { 是真实括号，位置按原文计算"""
+        result = BuiltInRules.check_braces(r"a\\{b")
+        assert result == ["Unmatched opening brace '{' at position 3"]
+
     def test_multiple_escaped_braces(self):
         """多个转义括号应被正确处理"""
         result = BuiltInRules.check_braces(r"\{ first \} and \{ second \}")
@@ -100,3 +105,21 @@ class TestCheckMathEnvironments:
         trans = "[[CITE_1]] 显示 $E=mc^2$"
         result = BuiltInRules.check_math_environments(orig, trans)
         assert result == []
+
+
+class TestBraceTextTokens:
+    """Test brace/text tokenization used by chunk brace structure checks."""
+
+    def test_escaped_braces_are_text(self):
+        """转义括号属于文本，\\\\ 之后的括号是真实括号"""
+        tokens = BuiltInRules._brace_text_tokens(r"a{\{b}\\{}c")
+        assert tokens == [
+            ("T", 0),
+            ("{", 1),
+            ("T", 2),
+            ("}", 5),
+            ("T", 6),
+            ("{", 8),
+            ("}", 9),
+            ("T", 10),
+        ]
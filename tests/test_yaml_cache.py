@@ -0,0 +1,93 @@
+"""Tests for the JSON sidecar cache of YAML rule files."""
+
+import os
+
+from ieeA.rules.yaml_cache import get_cache_dir, load_yaml_cached
+
+
+def test_cache_written_and_reused(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    source = tmp_path / "glossary.yaml"
+    source.write_text("attention:\n  target: 注意力\n", encoding="utf-8")
+
+    assert load_yaml_cached(source) == {"attention": {"target": "注意力"}}
+    cached = list(get_cache_dir().glob("glossary.*.json"))
+    assert len(cached) == 1
+
+    # 缓存命中时直接读取 JSON
+    cached[0].write_text('{"from": "cache"}', encoding="utf-8")
+    assert load_yaml_cached(source) == {"from": "cache"}
+
+
+def test_cache_invalidated_on_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    source = tmp_path / "config.yaml"
+    source.write_text("llm:\n  temperature: 0.1\n", encoding="utf-8")
+    load_yaml_cached(source)
+
+    source.write_text("llm:\n  temperature: 0.25\n", encoding="utf-8")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_yaml_cached(source) == {"llm": {"temperature": 0.25}}
+    assert len(list(get_cache_dir().glob("config.*.json"))) == 1
+
+
+def test_non_json_data_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    source = tmp_path / "dates.yaml"
+    source.write_text("1: one\n", encoding="utf-8")
+
+    assert load_yaml_cached(source) == {1: "one"}
+    assert not list(get_cache_dir().glob("dates.*.json"))
+
+
+def test_load_config_cached_until_file_changes(tmp_path, monkeypatch):
+    from ieeA.rules.config import load_config
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config_file = tmp_path / ".ieeA" / "config.yaml"
+    config_file.parent.mkdir()
+    config_file.write_text("llm:\n  temperature: 0.3\n", encoding="utf-8")
+
+    first = load_config()
+    assert first.llm.temperature == 0.3
+    # 返回副本，调用方修改不影响缓存
+    first.llm.temperature = 0.9
+    assert load_config().llm.temperature == 0.3
+
+    config_file.write_text("llm:\n  temperature: 0.7\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config().llm.temperature == 0.7
+
+
+def test_load_examples_returns_independent_copies(tmp_path):
+    from ieeA.rules.examples import load_examples
+
+    custom = tmp_path / "examples.yaml"
+    custom.write_text("- source: Hello\n  target: 你好\n", encoding="utf-8")
+
+    first = load_examples(str(custom))
+    first[-1]["target"] = "changed"
+    first.append({"source": "x", "target": "y"})
+
+    second = load_examples(str(custom))
+    assert second[-1] == {"source": "Hello", "target": "你好"}
+    assert len(second) == len(first) - 1
+
+
+def test_cache_dir_follows_env_override(tmp_path, monkeypatch):
+    from ieeA.rules.yaml_cache import CACHE_DIR_ENV
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    source = tmp_path / "glossary.yaml"
+    source.write_text("a: b\n", encoding="utf-8")
+
+    load_yaml_cached(source)
+    assert len(list((tmp_path / "cache").glob("glossary.*.json"))) == 1
+    assert not (tmp_path / "home").exists()
+
+    monkeypatch.delenv(CACHE_DIR_ENV)
+    assert get_cache_dir() == tmp_path / "home" / ".ieeA" / ".cache"